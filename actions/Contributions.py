@@ -8,11 +8,9 @@ from src.backend.PluginManager.ActionCore import ActionCore
 import os
 import time
 import threading
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from loguru import logger as log
-import requests
-from PIL import Image, ImageDraw
-from dateutil.relativedelta import relativedelta
+from PIL import Image
 
 # gi.require_version must be called before any gi.repository imports
 import gi  # noqa: E402
@@ -21,46 +19,31 @@ gi.require_version("Adw", "1")
 from gi.repository import Adw  # noqa: E402
 from GtkHelper.GenerativeUI.ComboRow import ComboRow  # noqa: E402
 
+# Import shared helpers
+from ..internal.RateLimit import RateLimitExceeded  # noqa: E402
+from ..internal.SettingsSnapshot import VersionedSettingsMixin  # noqa: E402
+from ..internal.LatestWinsQueue import LatestWinsQueue  # noqa: E402
+from ..internal.Profiling import profiled  # noqa: E402
+from ..internal.ContributionsRenderer import PALETTE_HEX, level_index, render_period  # noqa: E402
+from ..internal.ContributionsAggregator import ContributionsAggregator, bimonthly_ranges  # noqa: E402
+from ..internal.ContributionCalendar import ContributionCalendar  # noqa: E402
+
 debug = True
 
+# Days of calendar history kept when merging incremental fetches (the full calendar spans 53 weeks)
+CALENDAR_DAYS = 371
+# Days before the stored last date that are re-queried to pick up late-arriving counts
+DELTA_OVERLAP_DAYS = 2
+# Beyond this gap since the stored last date, a full calendar fetch is done instead of a delta
+DELTA_MAX_GAP_DAYS = 300
+
 
-class ContributionsActions(ActionCore):
+class ContributionsActions(VersionedSettingsMixin, ActionCore):
     """
     Action for displaying GitHub contributions by quarter.
     Fetches contribution data using the GitHub GraphQL API and displays summary stats.
     """
 
-    def pad_weeks(self, weeks, start_date, end_date):
-        """
-        Ensure all weeks between start_date and end_date are present in the weeks list.
-        If a week is missing, add it with all contributionCounts set to 0.
-        """
-        # Convert string dates to datetime
-        start = datetime.strptime(start_date, "%Y-%m-%d")
-        end = datetime.strptime(end_date, "%Y-%m-%d")
-        # Build a set of all week start dates in your data
-        week_starts = set(datetime.strptime(week['contributionDays'][0]['date'], "%Y-%m-%d") for week in weeks)
-        # Generate all week start dates in the range
-        all_week_starts = []
-        current = start
-        while current <= end:
-            all_week_starts.append(current)
-            current += timedelta(days=7)
-        # For each missing week, add a week with all 0s
-        for week_start in all_week_starts:
-            if week_start not in week_starts:
-                week = {
-                    "contributionDays": [
-                        {"contributionCount": 0, "date": (week_start + timedelta(days=i)).strftime("%Y-%m-%d")}
-                        for i in range(7)
-                        if (week_start + timedelta(days=i)) <= end
-                    ]
-                }
-                weeks.append(week)
-        # Sort weeks by their first day
-        weeks.sort(key=lambda w: w['contributionDays'][0]['date'])
-        return weeks
-
     # Serialises concurrent read-modify-write cycles in settings handlers so two
     # debounce callbacks firing close together cannot clobber each other's key.
     _settings_lock = threading.Lock()
@@ -69,6 +52,7 @@ class ContributionsActions(ActionCore):
     # _contributions_cache keyed by (github_user, github_token, last_date_str)
     # _cache_timestamp and _cache_params keyed by (github_user, github_token) so
     # multiple button instances with different users don't evict each other.
+    # Entries are mirrored to plugin_base.contributions_store so they survive restarts.
     _contributions_cache = {}
     _cache_timestamp = {}   # (github_user, github_token) -> float
     _cache_params = {}      # (github_user, github_token) -> (last_date_str, refresh_rate)
@@ -77,10 +61,14 @@ class ContributionsActions(ActionCore):
         super().__init__(*args, **kwargs)
         self._token_change_timeout_id = None
         self._user_change_timeout_id = None
-        self._refresh_timer_id = None  # For periodic refresh
+        self._key_user_change_timeout_id = None
+        # Job ids in the plugin's RefreshScheduler: periodic refresh and rate-limit resume
+        self._refresh_job_id = f"contributions:{id(self)}"
+        self._resume_job_id = f"contributions:{id(self)}:resume"
         self._debounce_timers = {}  # For periodic write of github_user, github_token, refresh_rate
-        self._last_settings = None
-        self._fetch_lock = threading.Lock()
+        self._last_settings_version = None
+        # Newest settings win: a fetch for superseded settings is cancelled and its UI updates dropped
+        self._fetch_queue = LatestWinsQueue(self.plugin_base.async_engine)
 
     def on_ready(self) -> None:
         settings = self.get_settings()
@@ -89,7 +77,7 @@ class ContributionsActions(ActionCore):
             log.info(f"[DEBUG] on_ready: selected_month_slot={selected_month_slot}")
         plugin_settings = self.plugin_base.get_settings()
         github_token = plugin_settings.get("github_token", "")
-        github_user = plugin_settings.get("github_user", "")
+        github_user = self.resolve_github_user(settings, plugin_settings)
         try:
             refresh_rate = int(plugin_settings.get("refresh_rate", "0"))
         except (ValueError, TypeError):
@@ -107,12 +95,11 @@ class ContributionsActions(ActionCore):
             self.clear_labels("error")
             self.set_media(media_path=os.path.join(self.plugin_base.PATH, "assets", "info.png"), size=0.9)
             self.set_top_label("\nConfigure\nGithub\nPlugin", color=[255, 100, 100], outline_width=1, font_size=17)
-        self._last_settings = self.plugin_base.get_settings().copy()
+        self._last_settings_version = self.plugin_base.settings_version
         self.start_refresh_timer()
 
     def on_key_down(self) -> None:
-        settings = self.plugin_base.get_settings()
-        github_user = settings.get("github_user", "")
+        github_user = self.resolve_github_user(self.get_settings(), self.plugin_base.get_settings())
         if github_user:
             import webbrowser
             url = f"https://github.com/{github_user}"
@@ -121,9 +108,10 @@ class ContributionsActions(ActionCore):
             log.warning("Contributions: Cannot open user page, username missing.")
 
     def on_tick(self):
-        current_settings = self.plugin_base.get_settings().copy()
-        if current_settings != self._last_settings:
-            self._last_settings = current_settings
+        # Only plugin-wide settings trigger a refetch; their version moves on set_settings()
+        current_version = self.plugin_base.settings_version
+        if current_version != self._last_settings_version:
+            self._last_settings_version = current_version
             self.fetch_and_display_contributions()
 
     def on_key_up(self) -> None:
@@ -135,6 +123,7 @@ class ContributionsActions(ActionCore):
         plugin_settings = self.plugin_base.get_settings()
         github_token = plugin_settings.get("github_token", "")
         github_user = plugin_settings.get("github_user", "")
+        key_github_user = settings.get("github_user", "")
         refresh_rate = plugin_settings.get("refresh_rate", "0")
 
         # Token entry
@@ -147,6 +136,11 @@ class ContributionsActions(ActionCore):
         user_entry.set_text(github_user)
         user_entry.connect("notify::text", self.on_user_changed)
 
+        # Per-key username; empty shows the plugin-wide user above
+        key_user_entry = Adw.EntryRow(title="GitHub Username (this key, optional)")
+        key_user_entry.set_text(key_github_user)
+        key_user_entry.connect("notify::text", self.on_key_user_changed)
+
         # ComboRow for refresh rate (hours)
         refresh_options = ["0", "1", "6", "12", "24"]
         refresh_rate_row = ComboRow(
@@ -169,10 +163,10 @@ class ContributionsActions(ActionCore):
             ]
         if not month_labels or len(month_labels) == 0:
             # fallback to all possible periods if not yet populated
-            bimonthly_ranges = self.get_bimonthly_ranges(datetime.now())
+            periods = self.get_bimonthly_ranges(datetime.now())
             month_labels = [
                 f"{start.strftime('%b').upper()}-{end.strftime('%b').upper()} '{end.strftime('%y')}"
-                for start, end in bimonthly_ranges
+                for start, end in periods
             ]
         slot = settings.get("selected_month_slot", 5)
         if not isinstance(slot, int) or slot < 0 or slot >= len(month_labels):
@@ -200,13 +194,20 @@ class ContributionsActions(ActionCore):
         show_bottom_label_row.set_active(show_bottom_label)
         show_bottom_label_row.connect("notify::active", self.on_show_bottom_label_changed)
 
+        # Toggle for writing rendered images to disk (they are always shown from memory)
+        save_images_row = Adw.SwitchRow(title="Save Images to Disk")
+        save_images_row.set_active(plugin_settings.get("save_images_to_disk", True))
+        save_images_row.connect("notify::active", self.on_save_images_to_disk_changed)
+
         return [
             token_entry,
             user_entry,
+            key_user_entry,
             refresh_rate_row.widget,
             self.display_month_row.widget,
             show_top_label_row,
             show_bottom_label_row,
+            save_images_row,
         ]
 
     def on_token_changed(self, entry, *args):
@@ -225,9 +226,9 @@ class ContributionsActions(ActionCore):
             with ContributionsActions._settings_lock:
                 plugin_settings = self.plugin_base.get_settings()
                 plugin_settings["github_token"] = entry.get_text().strip()
-                github_user = plugin_settings.get("github_user", "")
+                github_user = self.resolve_github_user(self.get_settings(), plugin_settings)
                 self.plugin_base.set_settings(plugin_settings)
-            self._last_settings = self.plugin_base.get_settings().copy()
+            self._last_settings_version = self.plugin_base.settings_version
 
             if github_user.strip():
                 self.fetch_and_display_contributions()
@@ -255,7 +256,7 @@ class ContributionsActions(ActionCore):
                 plugin_settings["github_user"] = entry.get_text().strip()
                 github_token = plugin_settings.get("github_token", "")
                 self.plugin_base.set_settings(plugin_settings)
-            self._last_settings = self.plugin_base.get_settings().copy()
+            self._last_settings_version = self.plugin_base.settings_version
 
             if github_token.strip():
                 self.fetch_and_display_contributions()
@@ -265,6 +266,34 @@ class ContributionsActions(ActionCore):
         # Debounce: schedule after 500ms
         self._user_change_timeout_id = GLib.timeout_add(500, do_update)
 
+    def on_key_user_changed(self, entry, *args):
+        if debug:
+            log.info("[DEBUG] on_key_user_changed Triggered")
+        from gi.repository import GLib
+        if self._key_user_change_timeout_id is not None:
+            try:
+                GLib.source_remove(self._key_user_change_timeout_id)
+            except Exception:
+                pass
+            self._key_user_change_timeout_id = None
+
+        def do_update():
+            settings = self.get_settings()
+            settings["github_user"] = entry.get_text().strip()
+            self.set_settings(settings)
+            # Action settings do not move the plugin version watched by on_tick, so refetch here
+            self.fetch_and_display_contributions()
+            self._key_user_change_timeout_id = None
+            return False  # Only run once
+
+        # Debounce: schedule after 500ms
+        self._key_user_change_timeout_id = GLib.timeout_add(500, do_update)
+
+    @staticmethod
+    def resolve_github_user(action_settings, plugin_settings):
+        """The key's own GitHub username if set, otherwise the plugin-wide one."""
+        return action_settings.get("github_user") or plugin_settings.get("github_user", "")
+
     def on_refresh_rate_changed(self, widget, value, old):
         if debug:
             log.info("[DEBUG] on_refresh_rate_changed Triggered")
@@ -308,6 +337,12 @@ class ContributionsActions(ActionCore):
         self.set_settings(settings)
         self.fetch_and_display_contributions()
 
+    def on_save_images_to_disk_changed(self, widget, *args):
+        with ContributionsActions._settings_lock:
+            plugin_settings = self.plugin_base.get_settings()
+            plugin_settings["save_images_to_disk"] = widget.get_active()
+            self.plugin_base.set_settings(plugin_settings)
+
     def on_display_month_changed(self, widget, value, old):
         settings = self.get_settings()
         selected_label = value.get_value() if hasattr(value, "get_value") else value
@@ -339,7 +374,7 @@ class ContributionsActions(ActionCore):
                 img_path = filtered_images[idx]
                 count = filtered_counts[idx]
                 if img_path:
-                    self.set_media(media_path=img_path, size=0.68, valign=0.3)  # adjust valign to taste
+                    self.set_period_media(img_path)
 
                 # Top label: date range
                 show_top_label = settings.get("show_top_label", True)
@@ -370,469 +405,478 @@ class ContributionsActions(ActionCore):
     @staticmethod
     def get_bimonthly_ranges(last_date):
         # Go back 6 bimonthly periods (12 months total)
-        ranges = []
-        current_end = last_date.replace(day=1) + relativedelta(months=1) - relativedelta(days=1)
-        for _ in range(6):
-            current_start = current_end.replace(day=1) - relativedelta(months=1)
-            ranges.insert(0, (current_start, current_end))  # prepend
-            current_end = current_start - relativedelta(days=1)
-        return ranges
+        return bimonthly_ranges(last_date)
 
     def get_color(self, count):
-        if count == 0:
-            return "#3d444d"  # dark gray (inactive)
-        elif count < 8:
-            return "#2d8659"  # strong, deep green
-        elif count < 15:
-            return "#4ca96c"  # darker desaturated green
-        elif count < 22:
-            return "#73c48f"  # medium soft green
-        else:
-            return "#a3d9a5"  # light muted green
+        return PALETTE_HEX[level_index(count)]
 
-    def save_contributions_image(self, cell_map, quarter_idx, plugin_path, period_start, period_end, github_user=""):
+    @profiled("contributions.render")
+    def save_contributions_image(self, counts, quarter_idx, plugin_path, period_start, period_end, github_user="",
+                                 save_to_disk=True):
         """
         Draws a contribution image for the given period.
         Always shows all weeks (Sunday to Saturday) covering the period.
         Out-of-period days are colored white.
+        counts maps day ordinals to contribution counts (e.g. a ContributionCalendar).
+        The image is kept in the plugin's memory cache under its path; the PNG is written
+        in the background to the user's namespace in plugin_base.image_store when save_to_disk is set.
         """
-        cell_size = 12
-        padding = 0
-        # Calculate the first Sunday on/before period_start and last Saturday on/after period_end
-        if period_start.weekday() != 6:
-            first_sunday = period_start - timedelta(days=period_start.weekday() + 1)
-        else:
-            first_sunday = period_start
-        last_saturday = period_end + timedelta(days=(5 - period_end.weekday()) % 7)
-        # Build all week start dates
-        weeks = []
-        current = first_sunday
-        while current <= last_saturday:
-            weeks.append(current)
-            current += timedelta(days=7)
-        num_cols = len(weeks)
-        height = 7 * cell_size + (7 - 1) * padding
-
-        img = Image.new("RGB", (num_cols * (cell_size + padding), height), (255, 255, 255))  # type: ignore[arg-type]
-        draw = ImageDraw.Draw(img)
-
-        # Build a date->count map for fast lookup
-        date_to_count = {}
-        for key, (date_str, count) in cell_map.items():
-            date_to_count[date_str] = count
-
-        for col, week_start in enumerate(weeks):
-            for d in range(7):
-                day = week_start + timedelta(days=d)
-                x = col * (cell_size + padding)
-                y = d * (cell_size + padding)
-                box = [x, y, x + cell_size - 1, y + cell_size - 1]
-                if period_start <= day <= period_end:
-                    count = date_to_count.get(day.strftime("%Y-%m-%d"), 0)
-                    color = self.get_color(count)
-                else:
-                    color = "white"
-                draw.rectangle(box, fill=color)
-                draw.rectangle(box, outline="#777777", width=1)
-
-        cache_dir = os.path.join(plugin_path, "contributions_cache")
-        os.makedirs(cache_dir, exist_ok=True)
-        img_path = os.path.join(cache_dir, f"contributions_img_{github_user}_{quarter_idx + 1}.png")
-        tmp_path = img_path + ".tmp"
-        img.save(tmp_path, format="PNG")
-        os.replace(tmp_path, img_path)
+        with self.plugin_base.metrics.time("contributions_render_seconds"):
+            img = render_period(counts, period_start, period_end)
+
+        img_path = self.plugin_base.image_store.path_for(github_user, f"period_{quarter_idx + 1}.png")
+        self.plugin_base.image_cache.put(img_path, img)
+        if save_to_disk:
+            self.plugin_base.image_store.write_async(img_path, img)
         return img_path
 
+    def _has_image(self, img_path):
+        return img_path in self.plugin_base.image_cache or self.plugin_base.image_store.contains(img_path)
+
+    def load_period_image(self, img_path):
+        """Returns the image for img_path from memory, falling back to the PNG on disk, or None."""
+        image_cache = self.plugin_base.image_cache
+        img = image_cache.get(img_path)
+        if img is None and self.plugin_base.image_store.contains(img_path):
+            try:
+                with Image.open(img_path) as png:
+                    img = png.convert("RGB")
+            except Exception as e:
+                log.warning(f"Contributions: could not read {img_path}: {e}")
+                return None
+            image_cache.put(img_path, img)
+        return img
+
+    def set_period_media(self, img_path):
+        img = self.load_period_image(img_path)
+        if img is not None:
+            self.set_media(image=img, size=0.68, valign=0.3)  # adjust valign to taste
+        else:
+            self.set_media(media_path=os.path.join(self.plugin_base.PATH, "assets", "info.png"), size=0.9)
+
     def fetch_and_display_contributions(self):
-        if not self._fetch_lock.acquire(blocking=False):
+        if not self._fetch_queue.submit(self.settings_version, self._fetch_and_display):
             if debug:
-                log.info("[DEBUG] fetch_and_display_contributions: fetch already in progress, skipping.")
-            return
-        threading.Thread(target=self._fetch_and_display_worker, daemon=True).start()
+                log.info("[DEBUG] fetch_and_display_contributions: fetch for these settings already in progress.")
 
-    def _fetch_and_display_worker(self):
+    @profiled("contributions.fetch_and_display")
+    async def _fetch_and_display(self, run):
+        """
+        Runs on the plugin's AsyncEngine: cache lookup, API call and rendering are awaited on its
+        executor, then the result is drawn on the GTK main loop unless a newer fetch superseded it.
+        """
+        snapshot = None
+        started = time.perf_counter()
         try:
-            self._do_fetch_and_display()
+            # Read one immutable snapshot for the whole fetch
+            snapshot = self.settings_snapshot()
+            error_label, labels, images, counts = await self._load_contributions(snapshot)
+            if error_label is not None:
+                run.to_ui(self.show_error, error_label)
+            else:
+                run.to_ui(self._display_contributions, snapshot.action, labels, images, counts)
+        except Exception as e:
+            import traceback
+            run.to_ui(self.show_error, "\nInternal\nError")
+            log.error(f"[DEBUG] API Internal Error:{e}", exc_info=True)
+            if snapshot is not None:
+                github_user = self.resolve_github_user(snapshot.action, snapshot.plugin)
+                github_token = snapshot.plugin.get("github_token", "")
+                log.error(
+                    f"[DEBUG] github_token={github_token[:13]}..., github_user={github_user}, "
+                    f"settings={dict(snapshot.action)}, "
+                    f"cache_params={ContributionsActions._cache_params.get((github_user, github_token))}"
+                )
+            log.error(traceback.format_exc())
         finally:
-            self._fetch_lock.release()
+            self.plugin_base.metrics.observe(
+                "action_fetch_duration_seconds", time.perf_counter() - started, action="contributions"
+            )
 
-    def _do_fetch_and_display(self):
+    def show_error(self, label):
         # Common red label parameters
         red = [255, 100, 100]
         kwargs = {"color": red, "outline_width": 1, "font_size": 17, "font_family": "cantarell"}
-        default_media = os.path.join(self.plugin_base.PATH, "assets", "info.png")
+        self.clear_labels("error")
+        self.set_top_label(label, **kwargs)
+        self.set_media(media_path=os.path.join(self.plugin_base.PATH, "assets", "info.png"), size=0.9)
+        self.set_background_color(color=[255, 255, 255, 255], update=True)
 
-        # Initialize to avoid possibly unbound variable errors in the except block
-        bimonthly_labels = []
-        bimonthly_images = []
-        bimonthly_counts = []
-        settings: dict = {}
-        github_token = ""
-        github_user = ""
-        refresh_rate: int = 0
+    async def _load_contributions(self, snapshot):
+        """
+        Resolves the labels, image paths and counts to show, from the cache or the API.
+        Blocking steps are awaited on the AsyncEngine executor; an API fetch runs once per
+        (token, user) at a time through async_engine.single_flight, so buttons sharing a user
+        await the same request without holding an executor thread.
+        Returns (error_label, labels, images, counts) where error_label is set instead of the
+        data when there is nothing to show.
+        """
+        engine = self.plugin_base.async_engine
+        plugin_settings = snapshot.plugin
+        github_token = plugin_settings.get("github_token", "")
+        github_user = self.resolve_github_user(snapshot.action, plugin_settings)
+        if debug:
+            log.info(f"[DEBUG] Fetching contributions for {github_user} with token={bool(github_token)}")
 
+        if not github_token or not github_user:
+            log.info("[DEBUG] No github_token or github_user, aborting fetch_and_display_contributions")
+            return "\nConfigure\nGithub\nPlugin", None, None, None
+
+        refresh_rate = plugin_settings.get("refresh_rate", "0")
         try:
-            settings = self.get_settings()
-            plugin_settings = self.plugin_base.get_settings()
-            github_token = plugin_settings.get("github_token", "")
-            github_user = plugin_settings.get("github_user", "")
-            if debug:
-                log.info(f"[DEBUG] Fetching contributions for {github_user} with token={bool(github_token)}")
-
-            # Ensure cache folder exists
-            plugin_path = self.plugin_base.PATH
-            cache_dir = os.path.join(plugin_path, "contributions_cache")
-            os.makedirs(cache_dir, exist_ok=True)
-
-            # Clean up orphaned .tmp files (only if older than 60s to avoid deleting in-flight writes)
-            # and stale images from old usernames
-            import time
-            now = time.time()
-            for fname in os.listdir(cache_dir):
-                fpath = os.path.join(cache_dir, fname)
-                if fname.endswith(".tmp"):
-                    try:
-                        if now - os.path.getmtime(fpath) > 60:
-                            os.remove(fpath)
-                    except Exception:
-                        pass
-                elif fname.endswith(".png"):
-                    if github_user and f"contributions_img_{github_user}_" not in fname:
-                        try:
-                            os.remove(fpath)
-                        except Exception:
-                            pass
-
-            if not github_token or not github_user:
-                log.info("[DEBUG] No github_token or github_user, aborting fetch_and_display_contributions")
-                self.clear_labels("error")
-                self.set_background_color(color=[255, 255, 255, 255], update=True)
-                self.set_top_label("\nConfigure\nGithub\nPlugin", **kwargs)
-                self.set_media(media_path=default_media, size=0.9)
-                return
-
-            # ---- CACHE LOGIC ----
-            cache_key = None
-            last_date_str = None
-            cache_valid = False
-            refresh_rate = plugin_settings.get("refresh_rate", "0")
+            refresh_rate = int(refresh_rate)
+        except Exception:
+            refresh_rate = 0
+
+        entry = await engine.run_blocking(self._cached_entry, github_user, github_token, refresh_rate)
+
+        # After all cache checks, if there is no usable entry, fetch from API
+        self.plugin_base.metrics.inc("contributions_cache_total", result="hit" if entry is not None else "miss")
+        if entry is None:
+            save_to_disk = plugin_settings.get("save_images_to_disk", True)
             try:
-                refresh_rate = int(refresh_rate)
-            except Exception:
-                refresh_rate = 0
-
-            # We'll determine last_date after API call or from cache
-            # But first, check if we have a cache for this user/token/period
-            now = time.time()
-            instance_key = (github_user, github_token)
-            cache_params = ContributionsActions._cache_params.get(instance_key)
-            cache_timestamp = ContributionsActions._cache_timestamp.get(instance_key)
-
-            if cache_params is not None:
-                cached_last_date_str, _ = cache_params
-                # If refresh_rate is 0, always use cache if available (never refresh from API)
-                # If refresh_rate > 0, use cache only if not expired
-                cache_not_expired = (
-                    cache_timestamp is not None and
-                    (refresh_rate == 0 or (now - cache_timestamp) < refresh_rate * 3600)
+                error_label, entry = await engine.single_flight(
+                    ("contributions", github_token, github_user),
+                    lambda: engine.run_blocking(
+                        self._fetch_contributions, github_user, github_token, refresh_rate, save_to_disk
+                    ),
                 )
-                if cache_not_expired:
-                    cache_key = (github_user, github_token, cached_last_date_str)
-                    if cache_key in ContributionsActions._contributions_cache:
-                        cache_valid = True
-                        last_date_str = cached_last_date_str
-
-            if cache_valid:
-                if debug:
-                    log.info("[CACHE] Using cached contributions data and images.")
-                cache = ContributionsActions._contributions_cache[cache_key]
-                bimonthly_labels = cache["labels"]
-                bimonthly_images = cache["images"]
-                bimonthly_counts = cache["counts"]
-                # Invalidate cache if any image file no longer exists on disk
-                if any(img and not os.path.exists(img) for img in bimonthly_images):
-                    if debug:
-                        log.info("[CACHE] One or more cached image paths are missing, invalidating cache.")
-                    ContributionsActions._contributions_cache.pop(cache_key, None)
-                    cache_valid = False
-
-                if last_date_str is None:
-                    # Cache is invalid or corrupted, force a fresh fetch
-                    if debug:
-                        log.warning("[CACHE] last_date_str is None, forcing fresh fetch.")
-                    cache_valid = False
-
-            # After all cache checks, if cache_valid is still False, fetch from API
-            if not cache_valid:
-                # --- API CALL ---
-                query = """
-                query($login: String!) {
-                  user(login: $login) {
-                    contributionsCollection {
-                      contributionCalendar {
-                        weeks {
-                          contributionDays {
-                            contributionCount
-                            date
-                          }
-                        }
-                      }
-                    }
-                  }
-                }
-                """
-
-                headers = {
-                    "Authorization": f"Bearer {github_token}"
-                }
-
-                try:
-                    if debug:
-                        log.info(f"[API] Making GitHub contributions API call, refresh_rate={refresh_rate}")
-                    response = requests.post(
-                        "https://api.github.com/graphql",
-                        json={"query": query, "variables": {"login": github_user}},
-                        headers=headers,
-                        timeout=15
-                    )
-                    status = response.status_code
-                    # import json
-                    # with open(os.path.join(self.plugin_base.PATH, "actions/response.json"), "r") as f:
-                    #     data = json.load(f)
-                    # status = 200
-
-                    if status != 200:
-                        self.clear_labels("error")
-                        label = "\nInvalid\nToken" if status == 401 else "\nAPI\nError"
-                        self.set_top_label(label, **kwargs)
-                        self.set_media(media_path=default_media, size=0.9)
-                        self.set_background_color(color=[255, 255, 255, 255], update=True)
-                        return
-
-                    data = response.json()
-                    if "data" not in data or data["data"]["user"] is None:
-                        self.clear_labels("error")
-                        self.set_top_label("\nUser\nNot Found", **kwargs)
-                        self.set_media(media_path=default_media, size=0.9)
-                        self.set_background_color(color=[255, 255, 255, 255], update=True)
-                        return
-
-                    weeks_data = data["data"]["user"]["contributionsCollection"]["contributionCalendar"]["weeks"]
-                    if not weeks_data:
-                        self.clear_labels("error")
-                        self.set_top_label("\nNo\nData", **kwargs)
-                        self.set_media(media_path=default_media, size=0.9)
-                        self.set_background_color(color=[255, 255, 255, 255], update=True)
-                        return
-
-                    # Pad the entire weeks_data once to cover the full range
-                    all_dates = [day["date"] for week in weeks_data for day in week["contributionDays"]]
-                    min_date = min(all_dates)
-                    max_date = max(all_dates)
-                    weeks_data = self.pad_weeks(weeks_data, min_date, max_date)
-
-                    last_week = weeks_data[-1]
-                    last_day = last_week["contributionDays"][-1]["date"]
-                    last_date = datetime.strptime(last_day, "%Y-%m-%d")
-                    last_date_str = last_day
-
-                    bimonthly_ranges = self.get_bimonthly_ranges(last_date)
-                    bimonthly_counts, bimonthly_images, bimonthly_labels = [], [], []
-                    plugin_path = self.plugin_base.PATH
-
-                    for idx, (start, end) in enumerate(bimonthly_ranges):
-                        count = 0
-                        cell_map = {}
-                        # Build a date->count map for the period
-                        for week in weeks_data:
-                            for day in week["contributionDays"]:
-                                date_str = day["date"]
-                                date_obj = datetime.strptime(date_str, "%Y-%m-%d")
-                                if start <= date_obj <= end:
-                                    c = day["contributionCount"]
-                                    cell_map[(date_obj.isocalendar()[1], date_obj.weekday())] = (date_str, c)
-                                    count += c
-                        bimonthly_counts.append(count)
-                        label = (
-                            f"{start.strftime('%b').upper()}-{end.strftime('%b').upper()} "
-                            f"'{end.strftime('%y')} ({count})"
-                        )
-                        bimonthly_labels.append(label)
-                        if debug:
-                            log.info(f"[DEBUG] Built label: {label} with count: {count} for idx: {idx}")
-                        # Always generate the image for the full period, even if all zeros
-                        img_path = self.save_contributions_image(
-                            cell_map, idx, plugin_path,
-                            period_start=start, period_end=end,
-                            github_user=github_user
-                        )
-                        bimonthly_images.append(img_path)
-
-                    # Evict the previous cache entry for this instance before writing the new one.
-                    # last_date_str changes daily, so without eviction old keys accumulate forever.
-                    old_params = ContributionsActions._cache_params.get(instance_key)
-                    if old_params:
-                        old_last_date_str, _ = old_params
-                        old_key = (github_user, github_token, old_last_date_str)
-                        ContributionsActions._contributions_cache.pop(old_key, None)
-
-                    # Save to cache
-                    cache_key = (github_user, github_token, last_date_str)
-                    ContributionsActions._contributions_cache[cache_key] = {
-                        "labels": bimonthly_labels,
-                        "images": bimonthly_images,
-                        "counts": bimonthly_counts,
-                    }
-                    ContributionsActions._cache_timestamp[instance_key] = now
-                    ContributionsActions._cache_params[instance_key] = (last_date_str, refresh_rate)
-
-                except Exception as e:
-                    self.clear_labels("error")
-                    self.set_top_label("\nRequest\nFailed", **kwargs)
-                    self.set_media(media_path=default_media, size=0.9)
-                    self.set_background_color(color=[255, 255, 255, 255], update=True)
-                    log.error(f"[DEBUG] API Request Error:{e}", exc_info=True)
-                    return
-
-            # Set instance variables from cache or fresh fetch
-            self._quarter_labels = bimonthly_labels
-            self._quarter_images = bimonthly_images
-            self._quarter_counts = bimonthly_counts
+                if error_label is not None:
+                    return error_label, None, None, None
+
+            except RateLimitExceeded as e:
+                log.warning(f"Contributions: {e}")
+                self.schedule_rate_limit_resume(e.resume_at)
+                return "\nRate\nLimited", None, None, None
+            except Exception as e:
+                log.error(f"[DEBUG] API Request Error:{e}", exc_info=True)
+                return "\nRequest\nFailed", None, None, None
+
+        # Decode any image that is only on disk here, so the UI thread only hands it over
+        await engine.run_blocking(self._load_period_images, entry["images"])
+        return None, entry["labels"], entry["images"], entry["counts"]
+
+    def _cached_entry(self, github_user, github_token, refresh_rate):
+        """
+        Returns the cached entry for (github_user, github_token) if it is still fresh and all of
+        its images are available, otherwise None. Blocking (store and disk lookups).
+        """
+        # We'll determine last_date after API call or from cache
+        # But first, check if we have a cache for this user/token/period
+        now = time.time()
+        instance_key = (github_user, github_token)
+        if instance_key not in ContributionsActions._cache_params:
+            # Cold start: hydrate the class-level cache from the on-disk store
+            self._load_persisted_cache(github_user, github_token)
+        cache_params = ContributionsActions._cache_params.get(instance_key)
+        cache_timestamp = ContributionsActions._cache_timestamp.get(instance_key)
+        if cache_params is None:
+            return None
+
+        cached_last_date_str, _ = cache_params
+        # If refresh_rate is 0, always use cache if available (never refresh from API)
+        # If refresh_rate > 0, use cache only if not expired
+        cache_not_expired = (
+            cache_timestamp is not None and
+            (refresh_rate == 0 or (now - cache_timestamp) < refresh_rate * 3600)
+        )
+        if not cache_not_expired or cached_last_date_str is None:
+            return None
+        cache_key = (github_user, github_token, cached_last_date_str)
+        entry = ContributionsActions._contributions_cache.get(cache_key)
+        if entry is None:
+            return None
 
+        if debug:
+            log.info("[CACHE] Using cached contributions data and images.")
+        # Invalidate cache if any image is neither in memory nor on disk
+        if any(img and not self._has_image(img) for img in entry["images"]):
             if debug:
-                log.info(f"[DEBUG] All bimonthly_labels: {bimonthly_labels}")
-                log.info(f"[DEBUG] All bimonthly_counts: {bimonthly_counts}")
-
-            first_with_data = next(
-                ((lbl, img, cnt) for lbl, img, cnt in zip(
-                    reversed(bimonthly_labels), reversed(bimonthly_images), reversed(bimonthly_counts)
-                ) if cnt > 0),
-                (None, None, None)
-            )
+                log.info("[CACHE] One or more cached image paths are missing, invalidating cache.")
+            ContributionsActions._contributions_cache.pop(cache_key, None)
+            self.plugin_base.metrics.inc("contributions_cache_total", result="evict")
+            return None
+        return entry
+
+    def _load_period_images(self, img_paths):
+        for img_path in img_paths:
+            if img_path:
+                self.load_period_image(img_path)
 
-            if first_with_data[0] is None:
-                log.info("[DEBUG] No data found for any period, aborting.")
-                self.clear_labels("error")
-                self.set_top_label("\nActivity\nLog\nEmpty", **kwargs)
-                self.set_media(media_path=default_media, size=0.9)
-                self.set_background_color(color=[255, 255, 255, 255], update=True)
-                return
+    def _display_contributions(self, settings, bimonthly_labels, bimonthly_images, bimonthly_counts):
+        """Draws the selected period on the key. Runs on the GTK main loop."""
+        default_media = os.path.join(self.plugin_base.PATH, "assets", "info.png")
 
-            # Start clean
-            self.clear_labels("success")
+        # Set instance variables from cache or fresh fetch
+        self._quarter_labels = bimonthly_labels
+        self._quarter_images = bimonthly_images
+        self._quarter_counts = bimonthly_counts
 
-            # Resolve slot index: 0=oldest period, 5=newest/current period.
-            # Migration: if old string-based "selected_month" exists but no slot, find its position.
+        if debug:
+            log.info(f"[DEBUG] All bimonthly_labels: {bimonthly_labels}")
+            log.info(f"[DEBUG] All bimonthly_counts: {bimonthly_counts}")
+
+        first_with_data = next(
+            ((lbl, img, cnt) for lbl, img, cnt in zip(
+                reversed(bimonthly_labels), reversed(bimonthly_images), reversed(bimonthly_counts)
+            ) if cnt > 0),
+            (None, None, None)
+        )
+
+        if first_with_data[0] is None:
+            log.info("[DEBUG] No data found for any period, aborting.")
+            self.show_error("\nActivity\nLog\nEmpty")
+            return
+
+        # Start clean
+        self.clear_labels("success")
+
+        # Resolve slot index: 0=oldest period, 5=newest/current period.
+        # Migration: if old string-based "selected_month" exists but no slot, find its position.
+        slot = settings.get("selected_month_slot", None)
+        if slot is None:
             current_settings = self.get_settings()
-            slot = current_settings.get("selected_month_slot", None)
-            if slot is None:
-                old_key = current_settings.get("selected_month", "")
-                if old_key:
-                    label_parts = [lbl.split(" (")[0].upper() for lbl in bimonthly_labels]
-                    slot = label_parts.index(old_key.upper()) if old_key.upper() in label_parts else 5
-                else:
-                    slot = 5
-                # Persist the migrated slot so we don't re-migrate on next tick
-                current_settings["selected_month_slot"] = slot
-                self.set_settings(current_settings)
+            old_key = current_settings.get("selected_month", "")
+            if old_key:
+                label_parts = [lbl.split(" (")[0].upper() for lbl in bimonthly_labels]
+                slot = label_parts.index(old_key.upper()) if old_key.upper() in label_parts else 5
+            else:
+                slot = 5
+            # Persist the migrated slot so we don't re-migrate on next tick
+            current_settings["selected_month_slot"] = slot
+            self.set_settings(current_settings)
+
+        slot = max(0, min(int(slot), len(bimonthly_labels) - 1))
+        selected_label = bimonthly_labels[slot]
+
+        if debug:
+            log.info(f"[DEBUG] selected_month_slot={slot}, selected_label={selected_label}")
+
+        if hasattr(self, "display_month_row") and self.display_month_row is not None:
+            self.display_month_row.populate(
+                bimonthly_labels,
+                selected_item=None,
+                update_settings=False,
+                trigger_callback=False
+            )
+            self.display_month_row.set_value(selected_label)
 
-            slot = max(0, min(int(slot), len(bimonthly_labels) - 1))
-            selected_label = bimonthly_labels[slot]
+        if debug:
+            log.info(f"[DEBUG] Final selected_label: {selected_label}")
 
+        # Ensure img_path and count match the actual selected label
+        idx = bimonthly_labels.index(selected_label)
+        img_path = bimonthly_images[idx]
+        count = bimonthly_counts[idx]
+        if debug:
+            log.info(
+                f"[DEBUG] Using idx={idx}, count={count}, "
+                f"selected_label={selected_label}, img_path={img_path}"
+            )
+
+        # Top label (date range)
+        if settings.get("show_top_label", True):
             if debug:
-                log.info(f"[DEBUG] selected_month_slot={slot}, selected_label={selected_label}")
-
-            if hasattr(self, "display_month_row") and self.display_month_row is not None:
-                self.display_month_row.populate(
-                    bimonthly_labels,
-                    selected_item=None,
-                    update_settings=False,
-                    trigger_callback=False
-                )
-                self.display_month_row.set_value(selected_label)
+                log.info(f"[DEBUG] Setting top label to date range: {selected_label.split(' (')[0]}")
+            self.set_top_label(
+                selected_label.split(" (")[0],
+                color=[100, 255, 100],
+                outline_width=2,
+                font_size=13,
+                font_family="cantarell"
+            )
+        else:
+            if debug:
+                log.info("[DEBUG] Hiding top label")
+            self.set_top_label(None)
 
+        # Bottom label (contribution count)
+        if settings.get("show_bottom_label", True):
+            if debug:
+                log.info(f"[DEBUG] Setting bottom label to count: {count}")
+            self.set_bottom_label(
+                f"{count}",
+                color=[100, 255, 100],
+                outline_width=3,
+                font_size=16,
+                font_family="cantarell"
+            )
+        else:
             if debug:
-                log.info(f"[DEBUG] Final selected_label: {selected_label}")
+                log.info("[DEBUG] Hiding bottom label")
+            self.set_bottom_label(None)
 
-            # Ensure img_path and count match the actual selected label
-            idx = bimonthly_labels.index(selected_label)
-            img_path = bimonthly_images[idx]
-            count = bimonthly_counts[idx]
+        # Set contribution image
+        if img_path:
             if debug:
-                log.info(
-                    f"[DEBUG] Using idx={idx}, count={count}, "
-                    f"selected_label={selected_label}, img_path={img_path}"
-                )
+                log.info(f"[DEBUG] Setting media to img_path: {img_path}")
+            self.set_period_media(img_path)
+        else:
+            if debug:
+                log.info(f"[DEBUG] Setting media to default_media: {default_media}")
+            self.set_media(media_path=default_media, size=0.9)
 
-            # Top label (date range)
-            if self.get_settings().get("show_top_label", True):
-                if debug:
-                    log.info(f"[DEBUG] Setting top label to date range: {selected_label.split(' (')[0]}")
-                self.set_top_label(
-                    selected_label.split(" (")[0],
-                    color=[100, 255, 100],
-                    outline_width=2,
-                    font_size=13,
-                    font_family="cantarell"
-                )
-            else:
-                if debug:
-                    log.info("[DEBUG] Hiding top label")
-                self.set_top_label(None)
+    def _fetch_contributions(self, github_user, github_token, refresh_rate, save_to_disk=True):
+        """
+        Fetches the contribution calendar, renders the period images and stores the result in
+        the class-level cache. Runs once per (token, user) at a time through the engine's
+        single_flight, so buttons sharing a user reuse the same request.
+        Settings come from the caller's snapshot; save_to_disk is its save_images_to_disk flag.
+        Returns (error_label, entry) where entry holds the labels, images and counts.
+        """
+        instance_key = (github_user, github_token)
+
+        # Delta mode: reuse the stored calendar and only query the days since its last date
+        previous_entry = self._previous_entry(github_user, github_token) or {}
+        previous_calendar = previous_entry.get("calendar")
+        delta_from = None
+        if previous_calendar:
+            previous_last = datetime.fromordinal(previous_calendar.last_ordinal)
+            if (datetime.now() - previous_last).days <= DELTA_MAX_GAP_DAYS:
+                # Re-query a small overlap so late-arriving counts on recent days are picked up
+                delta_from = previous_last - timedelta(days=DELTA_OVERLAP_DAYS)
+
+        # --- API CALL ---
+        # Goes through the plugin's batcher: users refreshing together share one aliased query
+        date_from = date_to = None
+        if delta_from is not None:
+            date_from = delta_from.strftime("%Y-%m-%dT00:00:00Z")
+            date_to = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
-            # Bottom label (contribution count)
-            if self.get_settings().get("show_bottom_label", True):
-                if debug:
-                    log.info(f"[DEBUG] Setting bottom label to count: {count}")
-                self.set_bottom_label(
-                    f"{count}",
-                    color=[100, 255, 100],
-                    outline_width=3,
-                    font_size=16,
-                    font_family="cantarell"
-                )
-            else:
-                if debug:
-                    log.info("[DEBUG] Hiding bottom label")
-                self.set_bottom_label(None)
+        if debug:
+            mode = f"delta from {date_from}" if delta_from is not None else "full"
+            log.info(f"[API] Making GitHub contributions API call ({mode}), refresh_rate={refresh_rate}")
+        status, user_data = self.plugin_base.contributions_batcher.fetch(
+            github_token, github_user, date_from, date_to, timeout=15
+        )
 
-            # Set contribution image
-            if img_path:
-                if debug:
-                    log.info(f"[DEBUG] Setting media to img_path: {img_path}")
-                self.set_media(media_path=img_path, size=0.68, valign=0.3)  # adjust valign to taste
-            else:
+        if status != 200:
+            return ("\nInvalid\nToken" if status == 401 else "\nAPI\nError"), None
+
+        if user_data is None:
+            return "\nUser\nNot Found", None
+
+        weeks_data = user_data["contributionsCollection"]["contributionCalendar"]["weeks"]
+        # Dense, zero-filled day counts; replaces padding the nested week dicts
+        calendar = ContributionCalendar.from_weeks(weeks_data)
+        if delta_from is not None:
+            # Merge the delta over the stored calendar; closed periods keep their stored counts
+            calendar = previous_calendar.merge(calendar).tail(CALENDAR_DAYS)
+        elif not calendar:
+            return "\nNo\nData", None
+
+        last_date = datetime.fromordinal(calendar.last_ordinal)
+        last_date_str = calendar.last_day.isoformat()
+
+        # Period totals are O(1) prefix-sum lookups over the calendar
+        aggregator = ContributionsAggregator(calendar)
+        periods = self.get_bimonthly_ranges(last_date)
+        bimonthly_counts, bimonthly_images, bimonthly_labels = aggregator.totals(periods), [], []
+        plugin_path = self.plugin_base.PATH
+        # Periods whose day counts are unchanged keep their previous image instead of being re-rendered
+        previous_images = previous_entry.get("images") or []
+        previous_fingerprints = previous_entry.get("fingerprints") or []
+        fingerprints = []
+
+        for idx, ((start, end), count) in enumerate(zip(periods, bimonthly_counts)):
+            label = (
+                f"{start.strftime('%b').upper()}-{end.strftime('%b').upper()} "
+                f"'{end.strftime('%y')} ({count})"
+            )
+            bimonthly_labels.append(label)
+            if debug:
+                log.info(f"[DEBUG] Built label: {label} with count: {count} for idx: {idx}")
+            fingerprint = calendar.fingerprint(start, end)
+            fingerprints.append(fingerprint)
+            if (
+                idx < len(previous_fingerprints) and idx < len(previous_images)
+                and previous_fingerprints[idx] == fingerprint
+                and previous_images[idx] and self._has_image(previous_images[idx])
+            ):
                 if debug:
-                    log.info(f"[DEBUG] Setting media to default_media: {default_media}")
-                self.set_media(media_path=default_media, size=0.9)
-
-        except Exception as e:
-            import traceback
-            self.clear_labels("error")
-            self.set_top_label("\nInternal\nError", **kwargs)
-            self.set_media(media_path=default_media, size=0.9)
-            self.set_background_color(color=[255, 255, 255, 255], update=True)
-            log.error(f"[DEBUG] API Internal Error:{e}", exc_info=True)
-            log.error(
-                f"[DEBUG] github_token={github_token[:13]}..., github_user={github_user}, "
-                f"refresh_rate={refresh_rate}, settings={settings}, "
-                f"cache_params={ContributionsActions._cache_params.get((github_user, github_token))}"
+                    log.info(f"[DEBUG] Period {idx} unchanged, reusing {previous_images[idx]}")
+                # Keep the reused PNG recent in the store's LRU so it is not evicted before rewritten ones
+                self.plugin_base.image_store.touch(previous_images[idx])
+                bimonthly_images.append(previous_images[idx])
+                continue
+            # Always generate the image for the full period, even if all zeros
+            img_path = self.save_contributions_image(
+                calendar, idx, plugin_path,
+                period_start=start, period_end=end,
+                github_user=github_user, save_to_disk=save_to_disk
             )
-            log.error(traceback.format_exc())
+            bimonthly_images.append(img_path)
+
+        # Evict the previous cache entry for this instance before writing the new one.
+        # last_date_str changes daily, so without eviction old keys accumulate forever.
+        old_params = ContributionsActions._cache_params.get(instance_key)
+        if old_params:
+            old_last_date_str, _ = old_params
+            old_key = (github_user, github_token, old_last_date_str)
+            evicted = ContributionsActions._contributions_cache.pop(old_key, None)
+            if evicted is not None and old_last_date_str != last_date_str:
+                self.plugin_base.metrics.inc("contributions_cache_total", result="evict")
+
+        # Save to cache
+        cache_key = (github_user, github_token, last_date_str)
+        entry = {
+            "labels": bimonthly_labels,
+            "images": bimonthly_images,
+            "counts": bimonthly_counts,
+            "calendar": calendar,
+            "fingerprints": fingerprints,
+        }
+        fetched_at = time.time()
+        ContributionsActions._contributions_cache[cache_key] = entry
+        ContributionsActions._cache_timestamp[instance_key] = fetched_at
+        ContributionsActions._cache_params[instance_key] = (last_date_str, refresh_rate)
+
+        # Persist so a restart can render from disk without refetching
+        self.plugin_base.contributions_store.save(
+            github_user, github_token, last_date_str, fetched_at, refresh_rate, entry
+        )
+        return None, entry
 
-    def start_refresh_timer(self):
-        try:
-            from gi.repository import GLib
-        except ImportError:
+    @staticmethod
+    def _previous_entry(github_user, github_token):
+        """Returns the cached entry (labels, images, counts, calendar, fingerprints) for this user/token, or None."""
+        cache_params = ContributionsActions._cache_params.get((github_user, github_token))
+        if cache_params is None:
+            return None
+        return ContributionsActions._contributions_cache.get((github_user, github_token, cache_params[0]))
+
+    def _load_persisted_cache(self, github_user, github_token):
+        """Loads the stored entry for (github_user, github_token) into the class-level cache."""
+        stored = self.plugin_base.contributions_store.load(github_user, github_token)
+        if stored is None:
+            return
+        if debug:
+            log.info(f"[CACHE] Loaded persisted contributions for {github_user} (last date {stored['last_date_str']})")
+        instance_key = (github_user, github_token)
+        cache_key = (github_user, github_token, stored["last_date_str"])
+        ContributionsActions._contributions_cache[cache_key] = {
+            "labels": stored["labels"],
+            "images": stored["images"],
+            "counts": stored["counts"],
+            "calendar": stored.get("calendar"),
+            "fingerprints": stored.get("fingerprints"),
+        }
+        ContributionsActions._cache_timestamp[instance_key] = stored["fetched_at"]
+        ContributionsActions._cache_params[instance_key] = (stored["last_date_str"], stored["refresh_rate"])
+
+    def schedule_rate_limit_resume(self, resume_at):
+        scheduler = self.plugin_base.refresh_scheduler
+        # One pending resume per action is enough; the refetch picks up everything
+        if scheduler.next_run(self._resume_job_id) is not None:
             return
 
-        # Cancel any existing timer
-        if self._refresh_timer_id is not None:
-            try:
-                GLib.source_remove(self._refresh_timer_id)
-            except Exception:
-                pass
-            self._refresh_timer_id = None
+        delay = max(1, int(resume_at - time.time()) + 1)
+        if debug:
+            log.info(f"[DEBUG] Rate limited, resuming in {delay}s")
+        scheduler.schedule_once(self._resume_job_id, delay, self.fetch_and_display_contributions)
+
+    def start_refresh_timer(self):
+        scheduler = self.plugin_base.refresh_scheduler
 
         # Get refresh_rate from settings
         settings = self.plugin_base.get_settings()
@@ -842,28 +886,19 @@ class ContributionsActions(ActionCore):
         except Exception:
             refresh_rate = 0
 
-        # Don't start if refresh_rate is 0 or less
+        # Don't schedule if refresh_rate is 0 or less
         if not isinstance(refresh_rate, int) or refresh_rate <= 0:
+            scheduler.cancel(self._refresh_job_id)
             return
 
-        def _timer_callback():
-            try:
-                self.fetch_and_display_contributions()
-            except Exception:
-                pass  # Never crash the app
-            return True  # Continue timer
-
-        try:
-            self._refresh_timer_id = GLib.timeout_add_seconds(refresh_rate * 3600, _timer_callback)
-
-        except Exception:
-            self._refresh_timer_id = None
+        # Replaces any existing job for this action
+        scheduler.schedule(self._refresh_job_id, refresh_rate * 3600, self.fetch_and_display_contributions)
 
     def __del__(self):
         try:
-            from gi.repository import GLib
-            if self._refresh_timer_id is not None:
-                timer_id = self._refresh_timer_id
-                GLib.idle_add(GLib.source_remove, timer_id)
+            scheduler = self.plugin_base.refresh_scheduler
+            scheduler.cancel(self._refresh_job_id)
+            scheduler.cancel(self._resume_job_id)
+            self._fetch_queue.cancel()
         except Exception:
             pass
@@ -5,9 +5,8 @@ from src.backend.PluginManager.ActionHolder import ActionHolder  # noqa: F401
 
 # Import python modules
 import os
-import threading
+import time
 from loguru import logger as log
-import requests
 
 # gi.require_version must be called before any gi.repository imports
 import gi  # noqa: E402
@@ -16,8 +15,25 @@ gi.require_version("Adw", "1")
 from gi.repository import Adw  # noqa: E402
 from GtkHelper.GenerativeUI.ComboRow import ComboRow  # noqa: E402
 
-
-class PullRequestsActions(ActionBase):
+# Import shared helpers
+from ..internal.RateLimit import RateLimitExceeded  # noqa: E402
+from ..internal.PullRequestsFetcher import RED_ICON, YELLOW_ICON, GREEN_ICON, GRAY_ICON  # noqa: E402
+from ..internal.SettingsSnapshot import VersionedSettingsMixin  # noqa: E402
+from ..internal.LatestWinsQueue import LatestWinsQueue  # noqa: E402
+from ..internal.Profiling import profiled  # noqa: E402
+
+# CI icon color -> color of the PR count drawn on it
+COUNT_COLORS = {
+    RED_ICON: [200, 60, 60],
+    YELLOW_ICON: [210, 185, 0],
+    GREEN_ICON: [80, 200, 80],
+    GRAY_ICON: [200, 200, 200],
+}
+# Top label shown while the displayed count is a previous result being revalidated
+STALE_MARKER = "\u2022"
+
+
+class PullRequestsActions(VersionedSettingsMixin, ActionBase):
     """
     Example Action for PluginTemplate: PullRequests
     This action can be extended to fetch and display pull requests from a repository.
@@ -25,11 +41,16 @@ class PullRequestsActions(ActionBase):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self._refresh_timer_id = None
         self._token_change_timeout_id = None
         self._repo_url_change_timeout_id = None
-        self._last_settings = None
-        self._fetch_lock = threading.Lock()
+        # Job ids in the plugin's RefreshScheduler
+        self._refresh_job_id = f"pulls:{id(self)}"
+        self._resume_job_id = f"pulls:{id(self)}:resume"
+        self._last_settings_version = None
+        # Newest settings win: a fetch for superseded settings is cancelled and its UI updates dropped
+        self._fetch_queue = LatestWinsQueue(self.plugin_base.async_engine)
+        # (pr_count, icon_color, stale) currently on the key, None when it shows anything else
+        self._shown_state = None
 
     def on_ready(self) -> None:
         settings = self.get_settings()
@@ -37,14 +58,19 @@ class PullRequestsActions(ActionBase):
         repo_url = settings.get("repo_url", "")
         owner, repo = self.parse_owner_repo(repo_url)
         if github_token and owner and repo:
-            self.set_media(media_path=os.path.join(self.plugin_base.PATH, "assets", "#595959.png"), size=0.9)
+            # Show the last known result right away; the fetch below revalidates it
+            last_state = self.plugin_base.pull_requests_store.load(github_token, owner, repo)
+            if last_state is not None:
+                self.show_pull_request_state(last_state["pr_count"], last_state["icon_color"], stale=True)
+            else:
+                self.set_media(media_path=os.path.join(self.plugin_base.PATH, "assets", "#595959.png"), size=0.9)
             self.fetch_and_display_pull_request_count()
         else:
             self.clear_labels("error")
             self.set_media(media_path=os.path.join(self.plugin_base.PATH, "assets", "info.png"), size=0.9)
             self.set_top_label("\nConfigure\nGithub\nPlugin", color=[255, 100, 100], outline_width=1, font_size=17)
 
-        self._last_settings = {**self.plugin_base.get_settings(), **self.get_settings()}
+        self._last_settings_version = self.settings_version
         self.start_refresh_timer()
 
     def on_key_down(self) -> None:
@@ -88,7 +114,20 @@ class PullRequestsActions(ActionBase):
             auto_add=False
         )
 
-        return [token_entry, repo_entry, refresh_rate_row.widget]
+        # ComboRow for fetch mode: GraphQL counts in one round trip, REST walks every /pulls page
+        fetch_mode_options = ["GraphQL", "REST"]
+        fetch_mode = settings.get("fetch_mode", "GraphQL")
+        fetch_mode_row = ComboRow(
+            action_core=self,
+            var_name="fetch_mode",
+            default_value=fetch_mode if fetch_mode in fetch_mode_options else "GraphQL",
+            items=fetch_mode_options,
+            title="Fetch Mode",
+            on_change=self.on_fetch_mode_changed,
+            auto_add=False
+        )
+
+        return [token_entry, repo_entry, refresh_rate_row.widget, fetch_mode_row.widget]
 
     def on_token_changed(self, entry, *args):
         try:
@@ -105,7 +144,7 @@ class PullRequestsActions(ActionBase):
             plugin_settings = self.plugin_base.get_settings()
             plugin_settings["github_token"] = entry.get_text().strip()
             self.plugin_base.set_settings(plugin_settings)
-            self._last_settings = {**plugin_settings, **self.get_settings()}
+            self._last_settings_version = self.settings_version
             self.fetch_and_display_pull_request_count()
             self._token_change_timeout_id = None
             return False  # Only run once
@@ -127,7 +166,9 @@ class PullRequestsActions(ActionBase):
             settings = self.get_settings()
             settings["repo_url"] = entry.get_text().strip()
             self.set_settings(settings)
-            self._last_settings = {**self.plugin_base.get_settings(), **self.get_settings()}
+            self._last_settings_version = self.settings_version
+            # The previous repo's result is not a stale value of the new one
+            self.clear_labels("success")
             self.fetch_and_display_pull_request_count()
             self._repo_url_change_timeout_id = None
             return False  # Only run once
@@ -144,12 +185,10 @@ class PullRequestsActions(ActionBase):
         return "", ""
 
     def on_tick(self):
-        current_settings = {
-            **self.plugin_base.get_settings(),
-            **self.get_settings(),
-        }
-        if current_settings != self._last_settings:
-            self._last_settings = current_settings
+        # Settings versions only move on set_settings(), so this is a cheap tuple compare
+        current_version = self.settings_version
+        if current_version != self._last_settings_version:
+            self._last_settings_version = current_version
             self.fetch_and_display_pull_request_count()
 
     def on_refresh_rate_changed(self, widget, value, old):
@@ -160,9 +199,21 @@ class PullRequestsActions(ActionBase):
         if value is not None:
             settings["refresh_rate"] = value
         self.set_settings(settings)
+        self._last_settings_version = self.settings_version
         self.start_refresh_timer()
 
+    def on_fetch_mode_changed(self, widget, value, old):
+        settings = self.get_settings()
+        if hasattr(value, "get_value"):
+            value = value.get_value()
+        if value is not None:
+            settings["fetch_mode"] = value
+        self.set_settings(settings)
+        self._last_settings_version = self.settings_version
+        self.fetch_and_display_pull_request_count()
+
     def clear_labels(self, status):
+        self._shown_state = None
         self.set_top_label(None)
         self.set_center_label(None)
         self.set_bottom_label(None)
@@ -172,209 +223,157 @@ class PullRequestsActions(ActionBase):
             self.set_background_color(color=[255, 255, 255, 255], update=True)
 
     def fetch_and_display_pull_request_count(self):
-        self.set_media(media_path=os.path.join(self.plugin_base.PATH, "assets", "#595959.png"), size=0.9)
-        self.set_center_label("Loading...", color=[232, 232, 232], outline_width=1, font_size=14, font_family="cantarell")
-        self.set_bottom_label(None)
-        t = threading.Thread(target=self._fetch_worker, daemon=True)
-        t.start()
-
-    def _fetch_worker(self):
-        if not self._fetch_lock.acquire(blocking=False):
-            return
-        try:
-            self._do_fetch_and_display()
-        finally:
-            self._fetch_lock.release()
+        shown = self._shown_state
+        if shown is not None:
+            # Keep the current result on the key while it is refreshed, only marking it stale
+            self.show_pull_request_state(shown[0], shown[1], stale=True)
+        else:
+            self.set_media(media_path=os.path.join(self.plugin_base.PATH, "assets", "#595959.png"), size=0.9)
+            self.set_center_label(
+                "Loading...", color=[232, 232, 232], outline_width=1, font_size=14, font_family="cantarell"
+            )
+            self.set_bottom_label(None)
+        self._fetch_queue.submit(self.settings_version, self._do_fetch_and_display)
 
-    def _do_fetch_and_display(self):
+    def show_error(self, label):
         red = [255, 100, 100]
         kwargs = {"color": red, "outline_width": 1, "font_size": 17, "font_family": "cantarell"}
-        default_media = os.path.join(self.plugin_base.PATH, "assets", "info.png")
+        self.clear_labels("error")
+        self.set_top_label(label, **kwargs)
+        self.set_media(media_path=os.path.join(self.plugin_base.PATH, "assets", "info.png"), size=0.9)
+
+    @profiled("pull_requests.fetch_and_display")
+    async def _do_fetch_and_display(self, run):
+        """
+        Runs on the plugin's AsyncEngine loop; every key update is handed to the GTK main loop
+        through run.to_ui(), which drops it once a newer fetch has superseded this run.
+        """
+        engine = self.plugin_base.async_engine
+        ui = run.to_ui
+        started = time.perf_counter()
 
         try:
-            github_token = self.plugin_base.get_settings().get("github_token", "")
-            settings = self.get_settings()
-            repo_url = settings.get("repo_url", "")
+            # Read one immutable snapshot for the whole fetch
+            settings = self.settings_snapshot()
+            github_token = settings.plugin.get("github_token", "")
+            repo_url = settings.action.get("repo_url", "")
             owner, repo = self.parse_owner_repo(repo_url)
             log.info(f"Fetching pull requests for {owner}/{repo} (token: {github_token[:13]}...)")
 
             if not owner or not repo or not github_token:
-                self.clear_labels("error")
-                self.set_top_label("\nConfigure\nGithub\nPlugin", **kwargs)
-                self.set_media(media_path=default_media, size=0.9)
+                ui(self.show_error, "\nConfigure\nGithub\nPlugin")
                 return
 
-            url = f"https://api.github.com/repos/{owner}/{repo}/pulls"
-            headers = {
-                "Authorization": f"token {github_token}",
-                "Accept": "application/vnd.github+json"
-            }
-
             try:
-                # Fetch first page at 100 for efficient pagination; CI checks limited to first 25 SHAs
-                first_response = requests.get(url, headers=headers, params={"per_page": 100, "state": "open"}, timeout=10)
-                status = first_response.status_code
+                # Buttons pointing at the same repo with the same token share one in-flight fetch
+                fetch_mode = settings.action.get("fetch_mode", "GraphQL")
+                fetcher = self.plugin_base.pull_requests_fetcher
+                status, pr_count, shas, states = await engine.single_flight(
+                    ("pulls", fetch_mode, github_token, owner, repo),
+                    lambda: fetcher.fetch_open_pull_requests(fetch_mode, owner, repo, github_token)
+                )
 
                 if status == 200:
-                    first_page = first_response.json()
-
-                    # Count all pages for the total
-                    pr_count = len(first_page)
-                    next_url = None
-                    link = first_response.headers.get("Link", "")
-                    for part in link.split(","):
-                        if 'rel="next"' in part:
-                            next_url = part.split(";")[0].strip().strip("<>")
-                            break
-                    while next_url:
-                        response = requests.get(next_url, headers=headers, timeout=10)
-                        if response.status_code != 200:
-                            break
-                        pr_count += len(response.json())
-                        next_url = None
-                        link = response.headers.get("Link", "")
-                        for part in link.split(","):
-                            if 'rel="next"' in part:
-                                next_url = part.split(";")[0].strip().strip("<>")
-                                break
-
-                    self.clear_labels("success")
-                    self.set_center_label(
-                        f"{pr_count}", color=[200, 200, 200], outline_width=3, font_size=32, font_family="cantarell"
-                    )
-                    self.set_bottom_label(
-                        "PRs", color=[255, 255, 255], outline_width=2, font_size=15, font_family="cantarell"
-                    )
-                    self.set_media(media_path=os.path.join(self.plugin_base.PATH, "assets", "#595959.png"), size=0.9)
-                    if pr_count > 0:
-                        shas = [
-                            pr["head"]["sha"]
-                            for pr in first_page[:25]
-                            if isinstance(pr.get("head"), dict) and "sha" in pr["head"]
-                        ]
-                        self.fetch_and_set_commit_status_icons(owner, repo, shas, github_token, pr_count)
+                    store = self.plugin_base.pull_requests_store
+                    if pr_count == 0:
+                        icon_color = GRAY_ICON
+                    elif states is not None:
+                        # GraphQL mode already carried the CI rollup in the same request
+                        icon_color = fetcher.status_icon_color(states)
+                    else:
+                        # Keep the last known CI color, marked stale, while the check runs are looked up
+                        last_state = await engine.run_blocking(store.load, github_token, owner, repo)
+                        last_color = last_state["icon_color"] if last_state is not None else GRAY_ICON
+                        ui(self.show_pull_request_state, pr_count, last_color, stale=True)
+                        states = await self.fetch_commit_status_states(owner, repo, shas, github_token)
+                        icon_color = None if states is None else fetcher.status_icon_color(states)
+                    if icon_color is not None:
+                        ui(self.show_pull_request_state, pr_count, icon_color)
+                        await engine.run_blocking(
+                            store.save, github_token, owner, repo, pr_count, icon_color, time.time()
+                        )
                 else:
-                    self.clear_labels("error")
                     if status == 404:
-                        self.set_top_label("\nInvalid\nRepo URL", **kwargs)
+                        ui(self.show_error, "\nInvalid\nRepo URL")
                     elif status == 401:
-                        self.set_top_label("\nInvalid\nToken", **kwargs)
+                        ui(self.show_error, "\nInvalid\nToken")
                     else:
-                        self.set_top_label("\nConfigure\nGithub\nPlugin", **kwargs)
-                    self.set_media(media_path=default_media, size=0.9)
-
-            except Exception:
-                self.clear_labels("error")
-                self.set_top_label("\nRequest\nFailed", **kwargs)
-                self.set_media(media_path=default_media, size=0.9)
-        except Exception:
-            self.clear_labels("error")
-            self.set_top_label("\nInternal\nError", **kwargs)
-            self.set_media(media_path=default_media, size=0.9)
-
-    def fetch_and_set_commit_status_icons(self, owner, repo, shas, github_token, pr_count):
-        headers = {
-            "Authorization": f"token {github_token}",
-            "Accept": "application/vnd.github+json"
-        }
-
-        states = []
-
-        for sha in shas:
-            url = f"https://api.github.com/repos/{owner}/{repo}/commits/{sha}/check-runs"
-            try:
-                response = requests.get(url, headers=headers, timeout=10)
-                if response.status_code == 200:
-                    data = response.json()
-                    conclusions = [
-                        run.get("conclusion")
-                        for run in data.get("check_runs", [])
-                        if run.get("status") == "completed" and run.get("conclusion")
-                    ]
-                    in_progress = any(
-                        run.get("status") in ("in_progress", "queued")
-                        for run in data.get("check_runs", [])
-                    )
-
-                    log.info(f"SHA: {sha}, Check run conclusions: {conclusions}")
-
-                    # Add all conclusions and a sentinel for in-progress runs
-                    states.extend(conclusions)
-                    if in_progress:
-                        states.append("in_progress")
-                else:
-                    log.warning(f"Failed to fetch check-runs for SHA {sha}: {response.status_code}")
+                        ui(self.show_error, "\nConfigure\nGithub\nPlugin")
+
+            except RateLimitExceeded as e:
+                log.warning(f"PullRequests: {e}")
+                self.schedule_rate_limit_resume(e.resume_at)
+                if self._shown_state is not None:
+                    # The last known result stays up, still marked stale, until the resume
+                    return
+                ui(self.show_error, "\nRate\nLimited")
             except Exception as e:
-                log.error(f"Exception while fetching check-runs for {sha}: {e}")
-                continue
-
-        # Decide icon and count label color based on priority: failure > cancelled/in-progress > success
-        if "failure" in states:
-            icon_color = "#A00000"
-            count_color = [200, 60, 60]
-        elif "cancelled" in states or "in_progress" in states:
-            icon_color = "#B7B700"
-            count_color = [210, 185, 0]
-        elif "success" in states:
-            icon_color = "#236B23"
-            count_color = [80, 200, 80]
-        else:
-            icon_color = "#595959"
-            count_color = [200, 200, 200]
-
-        icon_path = os.path.join(self.plugin_base.PATH, "assets", f"{icon_color}.png")
-        self.set_media(media_path=icon_path, size=0.9)
-        self.set_center_label(
-            f"{pr_count}", color=count_color, outline_width=3, font_size=32, font_family="cantarell"
-        )
-        self.set_bottom_label(
-            "PRs", color=[255, 255, 255], outline_width=2, font_size=15, font_family="cantarell"
-        )
-
-    # Legacy way of checking
-    # def fetch_and_set_commit_status_icons(self, owner, repo, shas):
-    #     import requests
-    #     states = []
-    #     for sha in shas:
-    #         url = f"https://api.github.com/repos/{owner}/{repo}/commits/{sha}/status"
-    #         headers = {
-    #             "Authorization": f"token {self.get_settings().get('github_token', '')}",
-    #             "Accept": "application/vnd.github+json"
-    #         }
-    #         try:
-    #             response = requests.get(url, headers=headers, timeout=10)
-    #             if response.status_code == 200:
-    #                 data = response.json()
-    #                 state = data.get("state", "")
-    #                 states.append(state)
-    #                 log.info(f"URL: {url}, Sha: {sha}, State: {state}")
-    #         except Exception:
-    #             continue
-
-    #     # Set icon based on state priority
-    #     if "failure" in states:
-    #         # Set icon to red
-    #         self.set_media(media_path=os.path.join(self.plugin_base.PATH, "assets", "#A00000.png"), size=0.9)
-    #     elif "pending" in states:
-    #         # Set icon to yellow
-    #         self.set_media(media_path=os.path.join(self.plugin_base.PATH, "assets", "#B7B700.png"), size=0.9)
-    #     elif "success" in states:
-    #         # Set icon to green
-    #         self.set_media(media_path=os.path.join(self.plugin_base.PATH, "assets", "#236B23.png"), size=0.9)
+                if self._shown_state is not None:
+                    log.warning(f"PullRequests: refresh of {owner}/{repo} failed, keeping last result: {e}")
+                    return
+                ui(self.show_error, "\nRequest\nFailed")
+        except Exception as e:
+            log.error(f"PullRequests: internal error: {e}", exc_info=True)
+            ui(self.show_error, "\nInternal\nError")
+        finally:
+            self.plugin_base.metrics.observe(
+                "action_fetch_duration_seconds", time.perf_counter() - started, action="pull_requests"
+            )
 
-    def start_refresh_timer(self):
+    @profiled("pull_requests.check_runs")
+    async def fetch_commit_status_states(self, owner, repo, shas, github_token):
+        """Returns the check-run states of the given head SHAs, or None when deferred by the rate limit."""
         try:
-            from gi.repository import GLib
-        except ImportError:
+            return await self.plugin_base.async_engine.single_flight(
+                ("check-runs", github_token, owner, repo, tuple(shas)),
+                lambda: self.plugin_base.pull_requests_fetcher.collect_check_run_states(owner, repo, shas, github_token)
+            )
+        except RateLimitExceeded as e:
+            # Check runs are low priority: keep the current (stale) icon and resume once the budget resets
+            log.warning(f"PullRequests: deferring check-runs for {owner}/{repo}: {e}")
+            self.schedule_rate_limit_resume(e.resume_at)
+            return None
+
+    def show_pull_request_state(self, pr_count, icon_color, stale=False):
+        """
+        Shows a PR count on its CI icon, only touching the media and labels that differ from
+        what the key already shows. stale adds a small marker for a result being revalidated.
+        """
+        shown = self._shown_state
+        if shown is None:
+            self.clear_labels("success")
+            self.set_bottom_label(
+                "PRs", color=[255, 255, 255], outline_width=2, font_size=15, font_family="cantarell"
+            )
+        if shown is None or shown[1] != icon_color:
+            icon_path = os.path.join(self.plugin_base.PATH, "assets", f"{icon_color}.png")
+            self.set_media(media_path=icon_path, size=0.9)
+        if shown is None or shown[:2] != (pr_count, icon_color):
+            self.set_center_label(
+                f"{pr_count}", color=COUNT_COLORS.get(icon_color, COUNT_COLORS[GRAY_ICON]),
+                outline_width=3, font_size=32, font_family="cantarell"
+            )
+        if shown is None or shown[2] != stale:
+            if stale:
+                self.set_top_label(
+                    STALE_MARKER, color=[160, 160, 160], outline_width=1, font_size=14, font_family="cantarell"
+                )
+            else:
+                self.set_top_label(None)
+        self._shown_state = (pr_count, icon_color, stale)
+
+    def schedule_rate_limit_resume(self, resume_at):
+        scheduler = self.plugin_base.refresh_scheduler
+        # One pending resume per action is enough; the refetch picks up everything
+        if scheduler.next_run(self._resume_job_id) is not None:
             return
 
-        # Cancel any existing timer
-        if self._refresh_timer_id is not None:
-            try:
-                GLib.source_remove(self._refresh_timer_id)
-            except Exception:
-                pass
-            self._refresh_timer_id = None
+        delay = max(1, int(resume_at - time.time()) + 1)
+        log.info(f"PullRequests: resuming in {delay}s when the rate limit resets")
+        scheduler.schedule_once(self._resume_job_id, delay, self.fetch_and_display_pull_request_count)
+
+    def start_refresh_timer(self):
+        scheduler = self.plugin_base.refresh_scheduler
 
         # Get refresh_rate from settings and convert label to minutes
         settings = self.get_settings()
@@ -388,25 +387,23 @@ class PullRequestsActions(ActionBase):
         refresh_rate = rate_map.get(rate_label, 0)
 
         if refresh_rate <= 0:
+            scheduler.cancel(self._refresh_job_id)
             return
 
-        def _timer_callback():
-            try:
-                self.fetch_and_display_pull_request_count()
-            except Exception:
-                pass  # Never crash the app
-            return True  # Continue timer
+        # Replaces any existing job for this action
+        scheduler.schedule(self._refresh_job_id, refresh_rate * 60, self.fetch_and_display_pull_request_count)
 
+    def __del__(self):
         try:
-            self._refresh_timer_id = GLib.timeout_add_seconds(refresh_rate * 60, _timer_callback)
+            scheduler = self.plugin_base.refresh_scheduler
+            scheduler.cancel(self._refresh_job_id)
+            scheduler.cancel(self._resume_job_id)
+            self._fetch_queue.cancel()
         except Exception:
-            self._refresh_timer_id = None
-
-    def __del__(self):
+            pass
         try:
             from gi.repository import GLib
             for timer_id in (
-                self._refresh_timer_id,
                 self._token_change_timeout_id,
                 self._repo_url_change_timeout_id,
             ):
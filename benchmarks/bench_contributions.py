@@ -0,0 +1,211 @@
+"""
+Micro-benchmarks for the contributions refresh path, one stage at a time:
+
+    parse      json.loads of the GraphQL contributionCalendar response
+    pad        ContributionCalendar.from_weeks (dense, zero-filled day counts)
+    aggregate  prefix sums, bimonthly ranges, period totals and fingerprints
+    render     render_period for the six bimonthly images
+    encode     PNG encoding of the six images
+
+Synthetic calendars cover 1, 5 and 20 years, sparse (~15% active days) and dense (every day).
+Timings are compared against benchmarks/baselines/contributions.json as ratios to a fixed
+pure-Python calibration loop timed in alternation with each stage, so baselines carry across
+machines and load changes during a run; any stage still slower than --tolerance times its
+baseline after --confirm re-measurements is reported as a regression and the exit status is 1.
+
+    python benchmarks/bench_contributions.py
+    python benchmarks/bench_contributions.py --update-baseline
+"""
+
+# Import python modules
+import argparse
+import io
+import json
+import os
+import random
+import statistics
+import sys
+import timeit
+from datetime import date, timedelta
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from internal.ContributionCalendar import ContributionCalendar  # noqa: E402
+from internal.ContributionsAggregator import ContributionsAggregator, bimonthly_ranges  # noqa: E402
+from internal.ContributionsRenderer import render_period  # noqa: E402
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines", "contributions.json")
+STAGES = ("parse", "pad", "aggregate", "render", "encode")
+YEARS = (1, 5, 20)
+DENSITIES = {"sparse": 0.15, "dense": 1.0}
+LAST_DAY = date(2025, 6, 30)
+
+
+def synthetic_response(years, activity, seed=0):
+    """GraphQL contributions response body (as JSON text) covering `years` years up to LAST_DAY."""
+    rng = random.Random(seed)
+    first = LAST_DAY - timedelta(days=365 * years)
+    # GitHub's calendar starts on a Sunday
+    day = first - timedelta(days=(first.weekday() + 1) % 7)
+    weeks = []
+    while day <= LAST_DAY:
+        days = []
+        for _ in range(7):
+            if day > LAST_DAY:
+                break
+            count = rng.randint(1, 40) if rng.random() < activity else 0
+            days.append({"date": day.isoformat(), "contributionCount": count})
+            day += timedelta(days=1)
+        weeks.append({"contributionDays": days})
+    calendar = {"totalContributions": 0, "weeks": weeks}
+    return json.dumps({"data": {"user": {"contributionsCollection": {"contributionCalendar": calendar}}}})
+
+
+def _calibration_workload():
+    total = 0
+    for i in range(20000):
+        total += i * i % 7
+    return total
+
+
+def calibrate():
+    """Seconds for a fixed pure-Python workload; stage timings are reported relative to it."""
+    return measure(_calibration_workload)
+
+
+def measure(fn, repeat=5):
+    """Best per-call time of fn over `repeat` rounds of an auto-ranged number of calls."""
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def measure_relative(fn, repeat=5):
+    """
+    Returns (seconds, relative): the best per-call time of fn, and the median ratio of fn to the
+    calibration workload over `repeat` rounds that time one right after the other. Interleaving
+    makes a machine that slows down or speeds up mid-run (frequency scaling, noisy neighbours)
+    shift both sides of each ratio alike.
+    """
+    stage, calibration = timeit.Timer(fn), timeit.Timer(_calibration_workload)
+    stage_number, _ = stage.autorange()
+    calibration_number, _ = calibration.autorange()
+    times, ratios = [], []
+    for _ in range(repeat):
+        calibration_time = calibration.timeit(calibration_number) / calibration_number
+        stage_time = stage.timeit(stage_number) / stage_number
+        times.append(stage_time)
+        ratios.append(stage_time / calibration_time)
+    return min(times), statistics.median(ratios)
+
+
+def stage_functions(years, density):
+    """Returns {stage: zero-argument callable} for one synthetic calendar."""
+    body = synthetic_response(years, DENSITIES[density])
+    weeks = json.loads(body)["data"]["user"]["contributionsCollection"]["contributionCalendar"]["weeks"]
+    calendar = ContributionCalendar.from_weeks(weeks)
+    last_date = calendar.last_day
+    periods = bimonthly_ranges(last_date)
+    images = [render_period(calendar, start, end) for start, end in periods]
+
+    def aggregate():
+        aggregator = ContributionsAggregator(calendar)
+        ranges = bimonthly_ranges(last_date)
+        aggregator.totals(ranges)
+        for start, end in ranges:
+            calendar.fingerprint(start, end)
+
+    def render():
+        for start, end in periods:
+            render_period(calendar, start, end)
+
+    def encode():
+        for img in images:
+            img.save(io.BytesIO(), format="PNG")
+
+    return {
+        "parse": lambda: json.loads(body),
+        "pad": lambda: ContributionCalendar.from_weeks(weeks),
+        "aggregate": aggregate,
+        "render": render,
+        "encode": encode,
+    }
+
+
+def load_baseline(path):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="baseline file to compare against")
+    parser.add_argument("--update-baseline", action="store_true", help="write the results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=1.5, help="allowed slowdown factor before failing")
+    parser.add_argument("--repeat", type=int, default=5, help="timing rounds per stage (median ratio is kept)")
+    parser.add_argument("--confirm", type=int, default=2, help="re-measurements of a slow stage before failing")
+    args = parser.parse_args(argv)
+
+    calibration = calibrate()
+    functions, results = {}, {}
+    for years in YEARS:
+        for density in DENSITIES:
+            name = f"{years}y-{density}"
+            functions[name] = stage_functions(years, density)
+            results[name] = {stage: measure_relative(fn, args.repeat) for stage, fn in functions[name].items()}
+
+    baseline = None if args.update_baseline else load_baseline(args.baseline)
+    regressions = []
+    print(f"calibration: {calibration * 1e6:.1f} us")
+    print(f"{'calendar':<12}{'stage':<11}{'time':>12}{'relative':>10}{'baseline':>10}{'ratio':>8}")
+    for name, stages in results.items():
+        for stage in STAGES:
+            seconds, relative = stages[stage]
+            expected = (baseline or {}).get("results", {}).get(name, {}).get(stage)
+            # A slow stage is re-measured, calibration included, so one noisy stretch doesn't fail the run
+            for _ in range(args.confirm if expected else 0):
+                if relative <= expected * args.tolerance:
+                    break
+                retry_seconds, retry_relative = measure_relative(functions[name][stage], args.repeat)
+                seconds, relative = min(seconds, retry_seconds), min(relative, retry_relative)
+            stages[stage] = (seconds, relative)
+            line = f"{name:<12}{stage:<11}{seconds * 1e6:>10.1f}us{relative:>10.3f}"
+            if expected:
+                ratio = relative / expected
+                line += f"{expected:>10.3f}{ratio:>7.2f}x"
+                if ratio > args.tolerance:
+                    line += "  REGRESSION"
+                    regressions.append((name, stage, ratio))
+            print(line)
+
+    if args.update_baseline:
+        os.makedirs(os.path.dirname(args.baseline), exist_ok=True)
+        relative = {
+            name: {stage: round(relative, 4) for stage, (_, relative) in stages.items()}
+            for name, stages in results.items()
+        }
+        with open(args.baseline, "w") as f:
+            json.dump({"calibration_us": round(calibration * 1e6, 1), "results": relative}, f, indent=2)
+            f.write("\n")
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    if baseline is None:
+        print(f"No baseline at {args.baseline}; run with --update-baseline to create one", file=sys.stderr)
+        return 0
+
+    if regressions:
+        print(file=sys.stderr)
+        print(f"FAILED: {len(regressions)} stage(s) slower than {args.tolerance}x baseline:", file=sys.stderr)
+        for name, stage, ratio in regressions:
+            print(f"  {name} {stage}: {ratio:.2f}x", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,127 @@
+"""
+Offline benchmark of the PR fetch pipeline (count + CI check runs) against FakeGitHub.
+
+Runs PullRequestsFetcher through the same AsyncEngine / AsyncGithubClient / GithubClient
+stack the plugin uses, for every combination of fetch mode, open PR count and check runs
+per SHA, and reports per refresh: wall time, requests, bytes transferred and peak Python
+memory. Refresh 1 starts from a cold client; later refreshes reuse its ETag cache.
+
+    python benchmarks/bench_pull_requests.py
+    python benchmarks/bench_pull_requests.py --prs 10000 --checks 100 --latency 0.05 --json out.json
+"""
+
+# Import python modules
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from loguru import logger as log  # noqa: E402
+
+from fake_github import FakeGitHub  # noqa: E402
+from internal.AsyncEngine import AsyncEngine  # noqa: E402
+from internal.AsyncGithubClient import AsyncGithubClient  # noqa: E402
+from internal.GithubClient import GithubClient  # noqa: E402
+from internal.PullRequestsFetcher import PullRequestsFetcher  # noqa: E402
+
+TOKEN = "benchmark-token"
+
+
+def _csv_ints(value):
+    return [int(v) for v in value.split(",") if v]
+
+
+async def refresh(fetcher, fetch_mode, owner, repo):
+    """One PR key refresh as the action does it; returns (status, pr_count, icon_color)."""
+    status, pr_count, shas, states = await fetcher.fetch_open_pull_requests(fetch_mode, owner, repo, TOKEN)
+    if status != 200:
+        return status, 0, None
+    if pr_count and states is None:
+        states = await fetcher.collect_check_run_states(owner, repo, shas, TOKEN)
+    return status, pr_count, fetcher.status_icon_color(states or [])
+
+
+def run_scenario(server, fetch_mode, prs, checks, refreshes):
+    server.check_runs_per_sha = checks
+    engine = AsyncEngine()
+    client = GithubClient(api_url=server.url)
+    fetcher = PullRequestsFetcher(AsyncGithubClient(client, engine))
+    results = []
+    try:
+        for index in range(1, refreshes + 1):
+            server.reset_stats()
+            tracemalloc.start()
+            started = time.perf_counter()
+            status, pr_count, icon_color = engine.submit(refresh(fetcher, fetch_mode, "bench", f"prs-{prs}")).result()
+            wall = time.perf_counter() - started
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            stats = server.stats()
+            results.append({
+                "mode": fetch_mode,
+                "prs": prs,
+                "checks_per_sha": checks,
+                "refresh": index,
+                "wall_ms": round(wall * 1000, 1),
+                "requests": stats["requests"],
+                "bytes_sent": stats["bytes_sent"],
+                "bytes_received": stats["bytes_received"],
+                "peak_kib": round(peak / 1024, 1),
+                "status": status,
+                "pr_count": pr_count,
+                "icon_color": icon_color,
+            })
+    finally:
+        engine.shutdown()
+        client.close()
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--modes", default="GraphQL,REST", help="comma-separated fetch modes")
+    parser.add_argument("--prs", type=_csv_ints, default=[10, 1000, 10000], help="open PR counts")
+    parser.add_argument("--checks", type=_csv_ints, default=[0, 10, 100], help="check runs per SHA")
+    parser.add_argument("--latency", type=float, default=0.02, help="server latency per request in seconds")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="share of SHAs with a failed check run")
+    parser.add_argument("--refreshes", type=int, default=2, help="refreshes per scenario (1 cold, rest warm)")
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args(argv)
+
+    # The client and fetcher log every request and SHA at INFO
+    log.remove()
+    log.add(sys.stderr, level="WARNING")
+
+    rows = []
+    with FakeGitHub(latency=args.latency, failure_rate=args.failure_rate) as server:
+        for fetch_mode in [m.strip() for m in args.modes.split(",") if m.strip()]:
+            for prs in args.prs:
+                for checks in args.checks:
+                    rows.extend(run_scenario(server, fetch_mode, prs, checks, args.refreshes))
+
+    header = (
+        f"{'mode':<8}{'prs':>7}{'checks':>7}{'run':>4}{'wall ms':>10}{'reqs':>6}{'KiB out':>10}{'peak KiB':>10}  result"
+    )
+    print(header)
+    print("-" * len(header))
+    for row in rows:
+        print(
+            f"{row['mode']:<8}{row['prs']:>7}{row['checks_per_sha']:>7}{row['refresh']:>4}"
+            f"{row['wall_ms']:>10.1f}{row['requests']:>6}{row['bytes_sent'] / 1024:>10.1f}{row['peak_kib']:>10.1f}"
+            f"  {row['status']} {row['pr_count']} {row['icon_color']}"
+        )
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"latency": args.latency, "results": rows}, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
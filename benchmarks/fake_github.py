@@ -0,0 +1,213 @@
+# Import python modules
+import hashlib
+import json
+import re
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlencode, urlsplit
+
+_PULLS = re.compile(r"^/repos/([^/]+)/([^/]+)/pulls$")
+_CHECK_RUNS = re.compile(r"^/repos/([^/]+)/([^/]+)/commits/([0-9a-f]+)/check-runs$")
+# Synthetic repositories are named prs-<open PR count>, e.g. bench/prs-1000
+_REPO_NAME = re.compile(r"^prs-(\d+)$")
+
+
+def _sha(number):
+    return hashlib.sha1(f"pr-{number}".encode("ascii")).hexdigest()
+
+
+class FakeGitHub:
+    """
+    Local stand-in for the parts of the GitHub REST and GraphQL APIs the PR action uses:
+    GET /repos/{owner}/prs-<n>/pulls (paginated, Link headers, ETags), GET .../check-runs and
+    POST /graphql (totalCount + statusCheckRollup). Every response waits `latency` seconds
+    and is counted, so a benchmark can report requests and bytes per refresh.
+    check_runs_per_sha and failure_rate shape the CI data; both can be changed between runs.
+    """
+
+    def __init__(self, latency=0.02, check_runs_per_sha=10, failure_rate=0.0, host="127.0.0.1", port=0):
+        self.latency = latency
+        self.check_runs_per_sha = check_runs_per_sha
+        self.failure_rate = failure_rate
+        self._stats_lock = threading.Lock()
+        self.requests = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, name="fake-github", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def reset_stats(self):
+        with self._stats_lock:
+            self.requests = 0
+            self.bytes_sent = 0
+            self.bytes_received = 0
+
+    def stats(self):
+        with self._stats_lock:
+            return {"requests": self.requests, "bytes_sent": self.bytes_sent, "bytes_received": self.bytes_received}
+
+    def _record(self, received, sent):
+        with self._stats_lock:
+            self.requests += 1
+            self.bytes_received += received
+            self.bytes_sent += sent
+
+    # ---- synthetic data ----
+
+    @staticmethod
+    def pr_count(name):
+        match = _REPO_NAME.match(name)
+        return int(match.group(1)) if match else None
+
+    def _failed(self, sha):
+        return int(sha[:8], 16) % 10000 < self.failure_rate * 10000
+
+    @staticmethod
+    def _pull(owner, name, number):
+        sha = _sha(number)
+        return {
+            "url": f"https://api.github.com/repos/{owner}/{name}/pulls/{number}",
+            "id": 1000000 + number,
+            "number": number,
+            "state": "open",
+            "title": f"Synthetic pull request {number}",
+            "user": {"login": f"user{number % 97}", "id": number % 97, "type": "User"},
+            "body": "Benchmark payload. " * 20,
+            "created_at": "2025-01-01T00:00:00Z",
+            "updated_at": "2025-01-02T00:00:00Z",
+            "labels": [{"name": "benchmark", "color": "ededed"}],
+            "draft": False,
+            "head": {"label": f"{owner}:pr-{number}", "ref": f"pr-{number}", "sha": sha},
+            "base": {"label": f"{owner}:main", "ref": "main", "sha": _sha(0)},
+        }
+
+    def _check_runs(self, sha, graphql=False):
+        runs = []
+        for i in range(self.check_runs_per_sha):
+            conclusion = "failure" if i == 0 and self._failed(sha) else "success"
+            if graphql:
+                runs.append({"status": "COMPLETED", "conclusion": conclusion.upper()})
+            else:
+                runs.append({"id": i, "name": f"check-{i}", "head_sha": sha, "status": "completed",
+                             "conclusion": conclusion})
+        return runs
+
+    def _graphql(self, variables):
+        owner = variables.get("owner")
+        name = variables.get("name")
+        count = self.pr_count(name or "")
+        reset_at = (datetime.now(timezone.utc) + timedelta(hours=1)).strftime("%Y-%m-%dT%H:%M:%SZ")
+        data = {"rateLimit": {"cost": 1, "remaining": 4999, "resetAt": reset_at}, "repository": None}
+        if count is not None:
+            nodes = []
+            for number in range(count, max(count - variables.get("sample", 25), 0), -1):
+                sha = _sha(number)
+                contexts = self._check_runs(sha, graphql=True)[:100]
+                nodes.append({
+                    "headRefOid": sha,
+                    "commits": {"nodes": [{"commit": {"statusCheckRollup": {"contexts": {"nodes": contexts}}}}]},
+                })
+            data["repository"] = {"pullRequests": {"totalCount": count, "nodes": nodes}}
+        else:
+            return {"data": data, "errors": [{"type": "NOT_FOUND", "path": ["repository"],
+                                              "message": f"Could not resolve to a Repository '{owner}/{name}'."}]}
+        return {"data": data}
+
+    # ---- HTTP ----
+
+    def _handler_class(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def _send(self, status, body=None, headers=None, received=0):
+                payload = b"" if body is None else json.dumps(body, separators=(",", ":")).encode("utf-8")
+                etag = f'"{hashlib.sha1(payload).hexdigest()}"' if status == 200 else None
+                if etag is not None and self.headers.get("If-None-Match") == etag:
+                    status, payload = 304, b""
+                time.sleep(fake.latency)
+                self.send_response(status)
+                all_headers = {
+                    "Content-Type": "application/json; charset=utf-8",
+                    "Content-Length": str(len(payload)),
+                    "X-RateLimit-Limit": "5000",
+                    "X-RateLimit-Remaining": "4999",
+                    "X-RateLimit-Reset": str(int(time.time()) + 3600),
+                    **(headers or {}),
+                }
+                if etag is not None:
+                    all_headers["ETag"] = etag
+                for key, value in all_headers.items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(payload)
+                header_bytes = sum(len(key) + len(value) + 4 for key, value in all_headers.items())
+                fake._record(received, len(payload) + header_bytes)
+
+            def do_GET(self):
+                parts = urlsplit(self.path)
+                query = parse_qs(parts.query)
+                match = _PULLS.match(parts.path)
+                if match:
+                    owner, name = match.groups()
+                    count = fake.pr_count(name)
+                    if count is None:
+                        return self._send(404, {"message": "Not Found"})
+                    per_page = min(int(query.get("per_page", ["30"])[0]), 100)
+                    page = int(query.get("page", ["1"])[0])
+                    last_page = max((count + per_page - 1) // per_page, 1)
+                    # Newest first, like sort=created&direction=desc
+                    top = count - (page - 1) * per_page
+                    pulls = [fake._pull(owner, name, n) for n in range(top, max(top - per_page, 0), -1)]
+                    headers = {}
+                    if page < last_page:
+                        base = f"{fake.url}{parts.path}"
+
+                        def link(p):
+                            return f"{base}?{urlencode({'per_page': per_page, 'state': 'open', 'page': p})}"
+
+                        headers["Link"] = f'<{link(page + 1)}>; rel="next", <{link(last_page)}>; rel="last"'
+                    return self._send(200, pulls, headers)
+                match = _CHECK_RUNS.match(parts.path)
+                if match:
+                    runs = fake._check_runs(match.group(3))
+                    return self._send(200, {"total_count": len(runs), "check_runs": runs})
+                return self._send(404, {"message": "Not Found"})
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", "0"))
+                raw = self.rfile.read(length)
+                if urlsplit(self.path).path != "/graphql":
+                    return self._send(404, {"message": "Not Found"}, received=length)
+                request = json.loads(raw or b"{}")
+                self._send(200, fake._graphql(request.get("variables") or {}), {"X-RateLimit-Resource": "graphql"},
+                           received=length)
+
+        return Handler
@@ -0,0 +1,104 @@
+# Import python modules
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from loguru import logger as log
+
+from .Profiling import bind_blocking, profiling_enabled
+
+
+class AsyncEngine:
+    """
+    Plugin-owned asyncio event loop running on one background thread.
+    Actions submit coroutines instead of starting a thread per fetch; blocking work (HTTP
+    calls on the pooled session, rendering) is awaited through run_blocking(), which runs it
+    on one bounded executor, so requests inside a fetch can be gathered concurrently.
+    Results go back to the GTK main loop through to_ui().
+    """
+
+    def __init__(self, max_workers=16):
+        self._max_workers = max_workers
+        self._executor = None
+        self._loop = None
+        self._thread = None
+        self._flights = {}  # key -> asyncio.Task, only touched on the loop thread
+        self._lock = threading.Lock()
+        if profiling_enabled():
+            # Decided once at startup, so run_blocking carries no profiling check when disabled
+            self.run_blocking = self._run_blocking_profiled
+
+    def _ensure_started(self):
+        with self._lock:
+            if self._loop is None:
+                self._executor = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="github-io")
+                self._loop = asyncio.new_event_loop()
+                self._loop.set_default_executor(self._executor)
+                self._thread = threading.Thread(
+                    target=self._loop.run_forever, name="github-async-engine", daemon=True
+                )
+                self._thread.start()
+            return self._loop
+
+    def submit(self, coro):
+        """Schedules coro on the engine loop from any thread; returns a concurrent.futures.Future."""
+        future = asyncio.run_coroutine_threadsafe(coro, self._ensure_started())
+        future.add_done_callback(self._log_failure)
+        return future
+
+    @staticmethod
+    def _log_failure(future):
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
+            log.opt(exception=error).error(f"AsyncEngine: task failed: {error}")
+
+    async def run_blocking(self, fn, *args, **kwargs):
+        """Awaits fn(*args, **kwargs) run on the engine's bounded executor."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, functools.partial(fn, *args, **kwargs))
+
+    async def _run_blocking_profiled(self, fn, *args, **kwargs):
+        """run_blocking that records fn on its worker thread into the profiled hook awaiting it, if any."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, bind_blocking(fn, *args, **kwargs))
+
+    async def single_flight(self, key, factory):
+        """
+        Runs factory() once per key at a time; concurrent callers await the same task and share
+        its result or exception. A caller being cancelled does not cancel the shared task.
+        """
+        task = self._flights.get(key)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self._flights[key] = task
+            task.add_done_callback(lambda _: self._flights.pop(key, None))
+        return await asyncio.shield(task)
+
+    @staticmethod
+    def to_ui(fn, *args, **kwargs):
+        """Runs fn on the GTK main loop (directly when GLib is not available)."""
+        try:
+            from gi.repository import GLib
+        except ImportError:
+            fn(*args, **kwargs)
+            return
+
+        def run():
+            try:
+                fn(*args, **kwargs)
+            except Exception as e:
+                log.opt(exception=e).error(f"AsyncEngine: UI callback failed: {e}")
+            return False  # Only run once
+
+        GLib.idle_add(run)
+
+    def shutdown(self):
+        with self._lock:
+            loop, self._loop = self._loop, None
+            executor, self._executor = self._executor, None
+        if loop is not None:
+            loop.call_soon_threadsafe(loop.stop)
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
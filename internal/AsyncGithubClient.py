@@ -0,0 +1,55 @@
+# Import shared helpers
+from .RateLimit import PRIORITY_HIGH
+
+
+class AsyncGithubClient:
+    """
+    Awaitable facade over the pooled GithubClient for coroutines on the AsyncEngine loop.
+    Each call runs on the engine's bounded executor, so gathered calls share the client's
+    connection pool, ETag cache and rate-limit budget and really overlap on the network.
+    The *_json variants also decode a 200 body there, keeping JSON parsing off the loop.
+    """
+
+    def __init__(self, client, engine):
+        self.client = client
+        self._engine = engine
+
+    @property
+    def api_url(self):
+        return self.client.api_url
+
+    async def get(self, url, token, params=None, timeout=10, conditional=True, priority=PRIORITY_HIGH):
+        return await self._engine.run_blocking(
+            self.client.get, url, token, params=params, timeout=timeout, conditional=conditional, priority=priority
+        )
+
+    async def post(self, url, token, json=None, timeout=15, priority=PRIORITY_HIGH):
+        return await self._engine.run_blocking(
+            self.client.post, url, token, json=json, timeout=timeout, priority=priority
+        )
+
+    async def graphql(self, query, variables, token, timeout=15, priority=PRIORITY_HIGH):
+        return await self._engine.run_blocking(
+            self.client.graphql, query, variables, token, timeout=timeout, priority=priority
+        )
+
+    async def get_json(self, url, token, params=None, timeout=10, conditional=True, priority=PRIORITY_HIGH):
+        """get() that also decodes the body of a 200 response; returns (response, payload or None)."""
+        return await self._engine.run_blocking(
+            self._decoded, self.client.get, url, token,
+            params=params, timeout=timeout, conditional=conditional, priority=priority
+        )
+
+    async def graphql_json(self, query, variables, token, timeout=15, priority=PRIORITY_HIGH):
+        """graphql() that also decodes the body of a 200 response; returns (response, payload or None)."""
+        return await self._engine.run_blocking(
+            self._decoded, self.client.graphql, query, variables, token, timeout=timeout, priority=priority
+        )
+
+    @staticmethod
+    def _decoded(request, *args, **kwargs):
+        response = request(*args, **kwargs)
+        return response, (response.json() if response.status_code == 200 else None)
+
+    def record_graphql_rate_limit(self, token, data):
+        self.client.record_graphql_rate_limit(token, data)
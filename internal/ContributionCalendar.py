@@ -0,0 +1,154 @@
+# Import python modules
+import hashlib
+import struct
+import sys
+from array import array
+from datetime import date
+
+# Largest count an array("H") cell can hold; busier days are clamped
+MAX_DAY_COUNT = 0xFFFF
+
+
+def to_ordinal(day):
+    """Day ordinal of an int ordinal, date or datetime."""
+    return day if isinstance(day, int) else day.toordinal()
+
+
+class ContributionCalendar:
+    """
+    Compact daily contribution counts.
+    Counts live in an array("H") indexed by day offset from a base ordinal; every day between
+    the first and last day is present (missing days are zero-filled on construction), so a
+    year is ~730 bytes instead of a nested list of week and day dicts.
+    Days can be given as ordinals, dates or datetimes: calendar[day] is that day's count and
+    calendar[start:stop] is the sub-calendar for [start, stop).
+    """
+
+    __slots__ = ("base", "counts")
+
+    def __init__(self, base, counts=()):
+        self.base = base
+        self.counts = counts if isinstance(counts, array) else array("H", (min(c, MAX_DAY_COUNT) for c in counts))
+
+    @classmethod
+    def from_days(cls, days):
+        """Builds a dense calendar from (YYYY-MM-DD, count) pairs; duplicate dates are summed."""
+        parsed = [(date.fromisoformat(date_str).toordinal(), count) for date_str, count in days]
+        if not parsed:
+            return cls(0)
+        base = min(ordinal for ordinal, _ in parsed)
+        counts = [0] * (max(ordinal for ordinal, _ in parsed) - base + 1)
+        for ordinal, count in parsed:
+            counts[ordinal - base] += count
+        return cls(base, counts)
+
+    @classmethod
+    def from_weeks(cls, weeks):
+        """Builds a dense calendar from the GraphQL contributionCalendar.weeks structure."""
+        return cls.from_days(
+            (day["date"], day["contributionCount"]) for week in weeks for day in week["contributionDays"]
+        )
+
+    def to_bytes(self):
+        """Serialises to a little-endian base ordinal followed by the raw count array."""
+        counts = self.counts
+        if sys.byteorder != "little":
+            counts = array("H", counts)
+            counts.byteswap()
+        return struct.pack("<I", self.base) + counts.tobytes()
+
+    @classmethod
+    def from_bytes(cls, data):
+        (base,) = struct.unpack_from("<I", data)
+        counts = array("H")
+        counts.frombytes(data[4:])
+        if sys.byteorder != "little":
+            counts.byteswap()
+        return cls(base, counts)
+
+    def __len__(self):
+        return len(self.counts)
+
+    def __bool__(self):
+        return len(self.counts) > 0
+
+    def __eq__(self, other):
+        if not isinstance(other, ContributionCalendar):
+            return NotImplemented
+        return self.base == other.base and self.counts == other.counts
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            start = self.base if key.start is None else to_ordinal(key.start)
+            stop = self.base + len(self.counts) if key.stop is None else to_ordinal(key.stop)
+            lo = max(start - self.base, 0)
+            hi = min(stop - self.base, len(self.counts))
+            if hi <= lo:
+                return ContributionCalendar(max(start, self.base))
+            return ContributionCalendar(self.base + lo, self.counts[lo:hi])
+        return self.get(to_ordinal(key))
+
+    def get(self, ordinal, default=0):
+        index = ordinal - self.base
+        if 0 <= index < len(self.counts):
+            return self.counts[index]
+        return default
+
+    @property
+    def first_ordinal(self):
+        return self.base
+
+    @property
+    def last_ordinal(self):
+        return self.base + len(self.counts) - 1
+
+    @property
+    def first_day(self):
+        return date.fromordinal(self.first_ordinal)
+
+    @property
+    def last_day(self):
+        return date.fromordinal(self.last_ordinal)
+
+    def merge(self, other):
+        """Returns a calendar covering both ranges; other's counts win on overlapping days."""
+        if not other:
+            return ContributionCalendar(self.base, array("H", self.counts))
+        if not self:
+            return ContributionCalendar(other.base, array("H", other.counts))
+        base = min(self.base, other.base)
+        counts = array("H", bytes(2 * (max(self.last_ordinal, other.last_ordinal) - base + 1)))
+        offset = self.base - base
+        counts[offset:offset + len(self.counts)] = self.counts
+        offset = other.base - base
+        counts[offset:offset + len(other.counts)] = other.counts
+        return ContributionCalendar(base, counts)
+
+    def fingerprint(self, start, end):
+        """
+        Digest of the inclusive [start, end] range and its day counts (days outside the
+        calendar count as 0); equal fingerprints render to identical period images.
+        """
+        start, end = to_ordinal(start), to_ordinal(end)
+        digest = hashlib.blake2b(struct.pack("<II", start, end), digest_size=16)
+        digest.update(self.window(start, end).to_bytes())
+        return digest.hexdigest()
+
+    def window(self, start, end):
+        """The inclusive [start, end] range as a dense calendar, zero-filled where this one has no data."""
+        start, end = to_ordinal(start), to_ordinal(end)
+        counts = array("H", bytes(2 * max(end - start + 1, 0)))
+        lo = max(start, self.base)
+        hi = min(end, self.last_ordinal)
+        if lo <= hi:
+            counts[lo - start:hi - start + 1] = self.counts[lo - self.base:hi - self.base + 1]
+        return ContributionCalendar(start, counts)
+
+    def tail(self, days):
+        """The last `days` days of the calendar."""
+        return self[self.last_ordinal - days + 1:]
+
+    def days(self):
+        """Yields (YYYY-MM-DD, count) for every day in the calendar."""
+        for offset, count in enumerate(self.counts):
+            yield date.fromordinal(self.base + offset).isoformat(), count
@@ -0,0 +1,73 @@
+# Import python modules
+from datetime import timedelta
+from itertools import accumulate
+from dateutil.relativedelta import relativedelta
+
+from .ContributionCalendar import to_ordinal
+
+
+class ContributionsAggregator:
+    """
+    Prefix-sum index over a ContributionCalendar.
+    The calendar is already dense from its base ordinal, so the total of any inclusive
+    [start, end] range is two lookups, whatever the range type.
+    """
+
+    __slots__ = ("calendar", "_prefix")
+
+    def __init__(self, calendar):
+        self.calendar = calendar
+        self._prefix = [0, *accumulate(calendar.counts)]
+
+    def total(self, start, end):
+        """Sum of counts over the inclusive range [start, end] (dates, datetimes or ordinals)."""
+        base = self.calendar.base
+        lo = max(to_ordinal(start) - base, 0)
+        hi = min(to_ordinal(end) - base + 1, len(self.calendar))
+        if hi <= lo:
+            return 0
+        return self._prefix[hi] - self._prefix[lo]
+
+    def totals(self, ranges):
+        return [self.total(start, end) for start, end in ranges]
+
+
+def month_ranges(last_date, months_per_period, periods):
+    """
+    Consecutive calendar-month periods ending with the month containing last_date, oldest
+    first. Each range is (first day of its first month, last day of its last month).
+    """
+    ranges = []
+    current_end = last_date.replace(day=1) + relativedelta(months=1) - relativedelta(days=1)
+    for _ in range(periods):
+        current_start = current_end.replace(day=1) - relativedelta(months=months_per_period - 1)
+        ranges.insert(0, (current_start, current_end))  # prepend
+        current_end = current_start - relativedelta(days=1)
+    return ranges
+
+
+def bimonthly_ranges(last_date, periods=6):
+    # Go back 6 bimonthly periods (12 months total)
+    return month_ranges(last_date, 2, periods)
+
+
+def monthly_ranges(last_date, periods=12):
+    return month_ranges(last_date, 1, periods)
+
+
+def quarterly_ranges(last_date, periods=4):
+    # Calendar quarters (Jan-Mar, Apr-Jun, ...) ending with the quarter containing last_date
+    quarter_end_month = ((last_date.month - 1) // 3) * 3 + 3
+    quarter_end = last_date.replace(day=1, month=quarter_end_month)
+    return month_ranges(quarter_end, 3, periods)
+
+
+def rolling_week_ranges(last_date, weeks, periods=1):
+    """Back-to-back windows of `weeks` weeks, the newest ending on last_date, oldest first."""
+    ranges = []
+    end = last_date
+    for _ in range(periods):
+        start = end - timedelta(days=7 * weeks - 1)
+        ranges.insert(0, (start, end))
+        end = start - timedelta(days=1)
+    return ranges
@@ -0,0 +1,140 @@
+# Import python modules
+import threading
+import time
+from loguru import logger as log
+
+_USER_SELECTION = """
+  {alias}: user(login: ${alias}_login) {{
+    contributionsCollection{range_args} {{
+      contributionCalendar {{
+        weeks {{
+          contributionDays {{
+            contributionCount
+            date
+          }}
+        }}
+      }}
+    }}
+  }}"""
+
+
+class _Request:
+    __slots__ = ("login", "date_from", "date_to", "event", "status", "user", "error")
+
+    def __init__(self, login, date_from, date_to):
+        self.login = login
+        self.date_from = date_from
+        self.date_to = date_to
+        self.event = threading.Event()
+        self.status = None
+        self.user = None
+        self.error = None
+
+
+class ContributionsBatcher:
+    """
+    Collects contribution calendar lookups that arrive within `window` seconds for the same
+    token and sends them as one aliased GraphQL query (u0: user(...) u1: user(...) ...).
+    The first caller of a window waits it out and sends the batch; the others block until
+    their alias is split back out. The window is only held open when another login was looked
+    up with the same token within peer_ttl seconds: a single user's fetch is sent at once.
+    A missing user only nulls its own alias, so it surfaces as that caller's "User Not Found"
+    without failing the rest of the batch.
+    """
+
+    def __init__(self, client, window=0.25, max_batch=20, peer_ttl=24 * 3600):
+        self._client = client
+        self._window = window
+        self._max_batch = max_batch
+        # Longest refresh interval, so users refreshing on the same schedule stay known peers
+        self._peer_ttl = peer_ttl
+        self._pending = {}  # token -> [_Request, ...] collecting for the open window
+        self._seen = {}  # token -> {login: monotonic time of its last lookup}
+        self._lock = threading.Lock()
+
+    def fetch(self, token, login, date_from=None, date_to=None, timeout=15):
+        """
+        Returns (status_code, user) where user is the `user` object of the response (with its
+        contributionsCollection) or None if the login was not found. date_from/date_to are
+        ISO-8601 DateTime strings limiting the collection; None means the default year.
+        Raises whatever the request raised (e.g. RateLimitExceeded) for every caller in the batch.
+        """
+        request = _Request(login, date_from, date_to)
+        now = time.monotonic()
+        with self._lock:
+            seen = self._seen.setdefault(token, {})
+            for stale in [other for other, at in seen.items() if now - at >= self._peer_ttl]:
+                del seen[stale]
+            seen[login] = now
+            queue = self._pending.get(token)
+            leader = queue is None
+            if leader:
+                queue = self._pending[token] = []
+            queue.append(request)
+            # Nobody else can join when this is the only login recently seen for the token
+            wait = leader and len(seen) > 1
+
+        if leader:
+            if wait:
+                time.sleep(self._window)
+            with self._lock:
+                batch = self._pending.pop(token)
+            for i in range(0, len(batch), self._max_batch):
+                self._run(token, batch[i:i + self._max_batch], timeout)
+        else:
+            request.event.wait()
+
+        if request.error is not None:
+            raise request.error
+        return request.status, request.user
+
+    def _run(self, token, batch, timeout):
+        try:
+            self._send(token, batch, timeout)
+        except BaseException as e:
+            for request in batch:
+                request.error = e
+        finally:
+            for request in batch:
+                request.event.set()
+
+    @staticmethod
+    def build_query(batch):
+        """Builds the aliased query and its variables for a list of _Request."""
+        declarations = []
+        selections = []
+        variables = {}
+        for i, request in enumerate(batch):
+            alias = f"u{i}"
+            declarations.append(f"${alias}_login: String!")
+            variables[f"{alias}_login"] = request.login
+            range_args = []
+            for name, value in (("from", request.date_from), ("to", request.date_to)):
+                if value is not None:
+                    declarations.append(f"${alias}_{name}: DateTime")
+                    variables[f"{alias}_{name}"] = value
+                    range_args.append(f"{name}: ${alias}_{name}")
+            selections.append(_USER_SELECTION.format(
+                alias=alias, range_args=f"({', '.join(range_args)})" if range_args else ""
+            ))
+        query = (
+            f"query({', '.join(declarations)}) {{\n"
+            "  rateLimit {\n    cost\n    remaining\n    resetAt\n  }"
+            f"{''.join(selections)}\n}}"
+        )
+        return query, variables
+
+    def _send(self, token, batch, timeout):
+        query, variables = self.build_query(batch)
+        log.info(f"[API] Batched contributions query for {len(batch)} user(s)")
+        response = self._client.graphql(query, variables, token, timeout=timeout)
+        status = response.status_code
+        data = response.json() if status == 200 else {}
+        if status == 200:
+            self._client.record_graphql_rate_limit(token, data)
+            for error in data.get("errors") or []:
+                log.info(f"ContributionsBatcher: {error.get('path')}: {error.get('message')}")
+        users = data.get("data") or {}
+        for i, request in enumerate(batch):
+            request.status = status
+            request.user = users.get(f"u{i}")
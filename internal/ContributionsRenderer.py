@@ -0,0 +1,75 @@
+# Import python modules
+from PIL import Image
+
+CELL_SIZE = 12
+
+# Palette LUT: index 0 is out-of-period, 1-5 are the contribution levels
+PALETTE_HEX = ["#ffffff", "#3d444d", "#2d8659", "#4ca96c", "#73c48f", "#a3d9a5"]
+GRID_HEX = "#777777"
+
+
+def _rgb(hex_color):
+    return bytes(int(hex_color[i:i + 2], 16) for i in (1, 3, 5))
+
+
+_GRID_PIXEL = _rgb(GRID_HEX)
+# One interior scanline segment per palette index: grid line, 10 fill pixels, grid line
+_CELL_SEGMENTS = [
+    _GRID_PIXEL + _rgb(color) * (CELL_SIZE - 2) + _GRID_PIXEL for color in PALETTE_HEX
+]
+
+
+def level_index(count):
+    """Maps a day's contribution count to its palette index (1-5)."""
+    if count == 0:
+        return 1  # dark gray (inactive)
+    elif count < 8:
+        return 2  # strong, deep green
+    elif count < 15:
+        return 3  # darker desaturated green
+    elif count < 22:
+        return 4  # medium soft green
+    else:
+        return 5  # light muted green
+
+
+def period_grid(counts, period_start, period_end):
+    """
+    Builds the 7 x weeks palette-index matrix for a period. Columns are the Sunday-to-Saturday
+    weeks covering the period; counts maps day ordinals to contribution counts and days outside
+    the period get index 0.
+    """
+    start = period_start.toordinal()
+    end = period_end.toordinal()
+    first_sunday = start - (period_start.weekday() + 1) % 7
+    last_saturday = end + (5 - period_end.weekday()) % 7
+    num_cols = (last_saturday - first_sunday) // 7 + 1
+    get = counts.get
+    return [
+        [
+            level_index(get(day, 0)) if start <= day <= end else 0
+            for day in range(first_sunday + d, first_sunday + d + 7 * num_cols, 7)
+        ]
+        for d in range(7)
+    ]
+
+
+def render_grid(grid):
+    """
+    Renders a palette-index matrix to an RGB image with CELL_SIZE cells and 1px grid lines.
+    Scanlines are assembled from the precomputed per-index segments, so the cost is a few
+    bytes joins per row of cells instead of two rectangle draws per day.
+    """
+    num_cols = len(grid[0]) if grid else 0
+    width = num_cols * CELL_SIZE
+    grid_line = _GRID_PIXEL * width
+    rows = []
+    for row in grid:
+        interior = b"".join([_CELL_SEGMENTS[idx] for idx in row])
+        rows.append(grid_line + interior * (CELL_SIZE - 2) + grid_line)
+    return Image.frombytes("RGB", (width, len(grid) * CELL_SIZE), b"".join(rows))
+
+
+def render_period(counts, period_start, period_end):
+    """Renders the contribution image for a period from a {day ordinal: count} mapping."""
+    return render_grid(period_grid(counts, period_start, period_end))
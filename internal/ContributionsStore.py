@@ -0,0 +1,109 @@
+# Import python modules
+import json
+import os
+import sqlite3
+import struct
+import threading
+from loguru import logger as log
+
+from .ContributionCalendar import ContributionCalendar
+from .TokenFingerprint import token_fingerprint
+
+
+class ContributionsStore:
+    """
+    SQLite-backed persistence for the contributions cache, stored next to the image cache.
+    Keeps the fetched calendar, period labels, counts, image paths and fetch timestamp per
+    (github_user, token) so a restart can render from disk without hitting the API.
+    Tokens are never written to disk; rows are keyed by a SHA-256 fingerprint instead.
+    The calendar is stored as ContributionCalendar bytes in its own BLOB column.
+    """
+
+    def __init__(self, path):
+        self._path = path
+        self._conn = None
+        self._lock = threading.Lock()
+
+    def _connection(self):
+        """Opens the database on first use. Caller holds the lock."""
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self._path), exist_ok=True)
+            self._conn = sqlite3.connect(self._path, timeout=5, check_same_thread=False)
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS contributions (
+                    github_user TEXT NOT NULL,
+                    token_fingerprint TEXT NOT NULL,
+                    last_date TEXT NOT NULL,
+                    fetched_at REAL NOT NULL,
+                    refresh_rate INTEGER NOT NULL,
+                    payload TEXT NOT NULL,
+                    calendar BLOB,
+                    PRIMARY KEY (github_user, token_fingerprint)
+                )
+                """
+            )
+            # Databases created before the calendar column kept it as JSON inside payload
+            columns = {row[1] for row in self._conn.execute("PRAGMA table_info(contributions)")}
+            if "calendar" not in columns:
+                self._conn.execute("ALTER TABLE contributions ADD COLUMN calendar BLOB")
+            self._conn.commit()
+        return self._conn
+
+    def load(self, github_user, github_token):
+        """
+        Returns the stored entry as a dict with last_date_str, fetched_at, refresh_rate,
+        labels, images, counts and calendar, or None if nothing usable is stored.
+        """
+        try:
+            with self._lock:
+                row = self._connection().execute(
+                    "SELECT last_date, fetched_at, refresh_rate, payload, calendar FROM contributions "
+                    "WHERE github_user = ? AND token_fingerprint = ?",
+                    (github_user, token_fingerprint(github_token)),
+                ).fetchone()
+            if row is None:
+                return None
+            last_date_str, fetched_at, refresh_rate, payload, calendar = row
+            entry = json.loads(payload)
+            if calendar:
+                entry["calendar"] = ContributionCalendar.from_bytes(calendar)
+            elif entry.get("calendar"):
+                entry["calendar"] = ContributionCalendar.from_days(entry["calendar"])
+            else:
+                entry["calendar"] = None
+            entry.update(last_date_str=last_date_str, fetched_at=fetched_at, refresh_rate=refresh_rate)
+            return entry
+        except (sqlite3.Error, ValueError, struct.error) as e:
+            log.warning(f"ContributionsStore: could not load {github_user}: {e}")
+            return None
+
+    def save(self, github_user, github_token, last_date_str, fetched_at, refresh_rate, entry):
+        """Persists labels, images, counts and calendar of a cache entry, replacing the previous row."""
+        payload = json.dumps({
+            "labels": entry["labels"],
+            "images": entry["images"],
+            "counts": entry["counts"],
+            "fingerprints": entry.get("fingerprints"),
+        }, separators=(",", ":"))
+        calendar = entry.get("calendar")
+        calendar = calendar.to_bytes() if calendar else None
+        try:
+            with self._lock:
+                conn = self._connection()
+                conn.execute(
+                    "INSERT OR REPLACE INTO contributions "
+                    "(github_user, token_fingerprint, last_date, fetched_at, refresh_rate, payload, calendar) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (github_user, token_fingerprint(github_token), last_date_str,
+                     fetched_at, refresh_rate, payload, calendar),
+                )
+                conn.commit()
+        except sqlite3.Error as e:
+            log.warning(f"ContributionsStore: could not save {github_user}: {e}")
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -0,0 +1,145 @@
+# Import python modules
+import re
+import time
+import requests
+from requests.adapters import HTTPAdapter
+
+from .ResponseCache import ResponseCache, CachedResponse
+from .RateLimit import RateLimitBudget, RateLimitExceeded, PRIORITY_HIGH
+from .Metrics import MetricsRegistry
+
+API_URL = "https://api.github.com"
+
+# Collapse owners, repos, SHAs and numbers so metrics have one series per endpoint, not per URL
+_ENDPOINT_PATTERNS = (
+    (re.compile(r"^/repos/[^/]+/[^/]+"), "/repos/{owner}/{repo}"),
+    (re.compile(r"/[0-9a-f]{40}(?=/|$)"), "/{sha}"),
+    (re.compile(r"/\d+(?=/|$)"), "/{number}"),
+)
+
+
+class GithubClient:
+    """
+    Plugin-wide HTTP client for the GitHub API.
+    Owns a single pooled requests.Session shared by every action instance, so pagination
+    pages and check-run lookups reuse keep-alive connections instead of opening a new
+    TCP+TLS connection per request.
+    GET requests are sent as conditional requests (If-None-Match / If-Modified-Since)
+    when a validated copy is cached, and a 304 is answered from the cached body.
+    Every request passes through the shared per-token RateLimitBudget, which raises
+    RateLimitExceeded instead of sending work the remaining budget cannot afford.
+    Requests, latencies, failures and the remaining budget are recorded in `metrics`.
+    """
+
+    def __init__(self, api_url=API_URL, pool_connections=4, pool_maxsize=32, metrics=None):
+        self.api_url = api_url.rstrip("/")
+        self.graphql_url = f"{self.api_url}/graphql"
+        # pool_connections: number of per-host pools kept alive (api.github.com, github.com, ...)
+        # pool_maxsize: keep-alive connections kept per host pool
+        self._session = requests.Session()
+        self._session.headers.update({
+            "Accept": "application/vnd.github+json",
+            "X-GitHub-Api-Version": "2022-11-28",
+            "User-Agent": "StreamController-GithubPlugin",
+        })
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        self.response_cache = ResponseCache()
+        self.rate_limits = RateLimitBudget()
+        self.metrics = metrics if metrics is not None else MetricsRegistry()
+
+    @staticmethod
+    def _auth_headers(token):
+        return {"Authorization": f"Bearer {token}"} if token else {}
+
+    def _resource_for(self, url):
+        if url.startswith(self.graphql_url):
+            return "graphql"
+        if url.startswith(f"{self.api_url}/search/"):
+            return "search"
+        return "core"
+
+    def _endpoint_for(self, url):
+        path = url[len(self.api_url):] if url.startswith(self.api_url) else url
+        path = path.split("?", 1)[0]
+        for pattern, replacement in _ENDPOINT_PATTERNS:
+            path = pattern.sub(replacement, path)
+        return path
+
+    def _check_budget(self, token, resource, priority):
+        try:
+            self.rate_limits.check(token, resource, priority)
+        except RateLimitExceeded:
+            self.metrics.inc("github_rate_limited_total", resource=resource, source="budget")
+            raise
+
+    def _record_rate_limit(self, token, resource, response):
+        resume_at = self.rate_limits.update_from_headers(token, resource, response.headers, response.status_code)
+        resource = response.headers.get("X-RateLimit-Resource", resource)
+        remaining = self.rate_limits.remaining(token, resource)
+        if remaining is not None:
+            self.metrics.set("github_rate_limit_remaining", remaining, resource=resource)
+        if resume_at is not None:
+            self.metrics.inc("github_rate_limited_total", resource=resource, source="response")
+            raise RateLimitExceeded(resource, resume_at)
+
+    def _send(self, method, url, **kwargs):
+        endpoint = self._endpoint_for(url)
+        started = time.perf_counter()
+        try:
+            response = self._session.request(method, url, **kwargs)
+        except requests.RequestException as e:
+            self.metrics.inc("github_request_errors_total", method=method, endpoint=endpoint, error=type(e).__name__)
+            raise
+        self.metrics.observe(
+            "github_request_duration_seconds", time.perf_counter() - started, method=method, endpoint=endpoint
+        )
+        self.metrics.inc("github_requests_total", method=method, endpoint=endpoint, status=response.status_code)
+        return response
+
+    def get(self, url, token, params=None, timeout=10, conditional=True, priority=PRIORITY_HIGH):
+        resource = self._resource_for(url)
+        self._check_budget(token, resource, priority)
+        headers = self._auth_headers(token)
+        key = entry = None
+        if conditional:
+            key = ResponseCache.make_key(url, params, token)
+            entry = self.response_cache.get(key)
+            if entry is not None:
+                headers.update(entry.conditional_headers())
+
+        response = self._send("GET", url, headers=headers, params=params, timeout=timeout)
+        self._record_rate_limit(token, resource, response)
+
+        if key is not None:
+            if response.status_code == 304 and entry is not None:
+                return CachedResponse(entry, response)
+            if response.status_code == 200:
+                self.response_cache.store(key, response)
+            else:
+                self.response_cache.discard(key)
+        return response
+
+    def post(self, url, token, json=None, timeout=15, priority=PRIORITY_HIGH):
+        resource = self._resource_for(url)
+        self._check_budget(token, resource, priority)
+        response = self._send("POST", url, headers=self._auth_headers(token), json=json, timeout=timeout)
+        self._record_rate_limit(token, resource, response)
+        return response
+
+    def graphql(self, query, variables, token, timeout=15, priority=PRIORITY_HIGH):
+        return self.post(
+            self.graphql_url, token, json={"query": query, "variables": variables}, timeout=timeout, priority=priority
+        )
+
+    def record_graphql_rate_limit(self, token, data):
+        """Feeds the rateLimit { cost remaining resetAt } field of a GraphQL payload into the budget."""
+        self.rate_limits.update_from_graphql(token, (data.get("data") or {}).get("rateLimit"))
+        remaining = self.rate_limits.remaining(token, "graphql")
+        if remaining is not None:
+            self.metrics.set("github_rate_limit_remaining", remaining, resource="graphql")
+
+    def close(self):
+        self.response_cache.clear()
+        self._session.close()
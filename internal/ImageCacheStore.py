@@ -0,0 +1,140 @@
+# Import python modules
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from loguru import logger as log
+
+# Orphaned .tmp files younger than this may still be in-flight writes
+TMP_GRACE_SECONDS = 60
+
+
+class ImageCacheStore:
+    """
+    Managed on-disk cache for rendered PNGs.
+    Each user gets its own namespace directory under root, so buttons showing different
+    users never delete each other's images. An in-memory index (path -> size, in LRU order)
+    answers existence checks without touching the disk and keeps the total under max_bytes.
+    Writes and garbage collection run on the given executor, off the UI and fetch paths;
+    gc() rebuilds the index from disk, drops stale .tmp and legacy files and trims to budget.
+    """
+
+    def __init__(self, root, executor, max_bytes=32 * 1024 * 1024):
+        self._root = root
+        self._executor = executor
+        self._max_bytes = max_bytes
+        self._bytes = 0
+        self._index = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _namespace_dir(namespace):
+        return re.sub(r"[^A-Za-z0-9_.-]", "_", namespace) or "_"
+
+    def path_for(self, namespace, name):
+        return os.path.join(self._root, self._namespace_dir(namespace), name)
+
+    def contains(self, path):
+        """True if path is cached; falls back to one stat for files the index has not seen yet."""
+        with self._lock:
+            if path in self._index:
+                self._index.move_to_end(path)
+                return True
+        try:
+            size = os.path.getsize(path)
+        except OSError:
+            return False
+        self._record(path, size)
+        return True
+
+    def touch(self, path):
+        """Marks path as recently used, if it is indexed."""
+        with self._lock:
+            if path in self._index:
+                self._index.move_to_end(path)
+
+    def write_async(self, path, image):
+        """Queues the PNG write for path on the executor."""
+        return self._executor.submit(self._write, path, image)
+
+    def _write(self, path, image):
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = path + ".tmp"
+            image.save(tmp_path, format="PNG")
+            os.replace(tmp_path, path)
+            self._record(path, os.path.getsize(path))
+        except Exception as e:
+            log.warning(f"ImageCacheStore: could not write {path}: {e}")
+
+    def _record(self, path, size):
+        with self._lock:
+            self._bytes += size - self._index.pop(path, 0)
+            self._index[path] = size
+            evicted = self._evict_locked(keep=path)
+        self._remove(evicted)
+
+    def _evict_locked(self, keep=None):
+        """Pops least recently used paths until the budget holds. Caller holds the lock."""
+        evicted = []
+        for path in list(self._index):
+            if self._bytes <= self._max_bytes:
+                break
+            if path == keep:
+                continue
+            self._bytes -= self._index.pop(path)
+            evicted.append(path)
+        return evicted
+
+    @staticmethod
+    def _remove(paths):
+        for path in paths:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def schedule_gc(self):
+        """Queues gc() on the executor; meant to be called from a periodic scheduler job."""
+        self._executor.submit(self.gc)
+
+    def gc(self):
+        """Rebuilds the index from disk, removes stale .tmp and legacy files and enforces the budget."""
+        if not os.path.isdir(self._root):
+            return
+        now = time.time()
+        stale = []
+        found = []
+        for dirpath, _, filenames in os.walk(self._root):
+            for fname in filenames:
+                fpath = os.path.join(dirpath, fname)
+                try:
+                    stat = os.stat(fpath)
+                except OSError:
+                    continue
+                if fname.endswith(".tmp"):
+                    if now - stat.st_mtime > TMP_GRACE_SECONDS:
+                        stale.append(fpath)
+                elif fname.endswith(".png"):
+                    if dirpath == self._root:
+                        stale.append(fpath)  # pre-namespace layout
+                    else:
+                        found.append((stat.st_atime, fpath, stat.st_size))
+        self._remove(stale)
+
+        with self._lock:
+            # Files the index already tracks keep their LRU position; unseen ones go to the old end
+            index = OrderedDict(
+                (fpath, size) for _, fpath, size in sorted(found) if fpath not in self._index
+            )
+            on_disk = {fpath for _, fpath, _ in found}
+            for fpath, size in self._index.items():
+                if fpath in on_disk:
+                    index[fpath] = size
+            self._index = index
+            self._bytes = sum(index.values())
+            evicted = self._evict_locked()
+        self._remove(evicted)
+        if stale or evicted:
+            log.info(f"ImageCacheStore: removed {len(stale)} stale and {len(evicted)} evicted files")
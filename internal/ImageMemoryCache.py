@@ -0,0 +1,44 @@
+# Import python modules
+import threading
+from collections import OrderedDict
+
+
+class ImageMemoryCache:
+    """
+    Bounded LRU of rendered PIL images keyed by their cache path.
+    Lets actions hand images to set_media(image=...) directly instead of encoding a PNG,
+    writing it and having the key decode it again. Bounded by the decoded size in bytes.
+    """
+
+    def __init__(self, max_bytes=16 * 1024 * 1024):
+        self._max_bytes = max_bytes
+        self._bytes = 0
+        self._images = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def image_size(image):
+        return image.width * image.height * len(image.getbands())
+
+    def get(self, key):
+        with self._lock:
+            image = self._images.get(key)
+            if image is not None:
+                self._images.move_to_end(key)
+            return image
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._images
+
+    def put(self, key, image):
+        size = self.image_size(image)
+        with self._lock:
+            previous = self._images.pop(key, None)
+            if previous is not None:
+                self._bytes -= self.image_size(previous)
+            self._images[key] = image
+            self._bytes += size
+            while self._bytes > self._max_bytes and len(self._images) > 1:
+                _, evicted = self._images.popitem(last=False)
+                self._bytes -= self.image_size(evicted)
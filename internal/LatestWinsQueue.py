@@ -0,0 +1,65 @@
+# Import python modules
+import threading
+from loguru import logger as log
+
+
+class _Run:
+    __slots__ = ("version", "future", "superseded", "_engine")
+
+    def __init__(self, version, engine):
+        self.version = version
+        self.future = None
+        self.superseded = False
+        self._engine = engine
+
+    def to_ui(self, fn, *args, **kwargs):
+        """Like AsyncEngine.to_ui, but dropped if this run is superseded before the UI gets to it."""
+        def apply():
+            if not self.superseded:
+                fn(*args, **kwargs)
+
+        self._engine.to_ui(apply)
+
+
+class LatestWinsQueue:
+    """
+    Per-action fetch queue on the AsyncEngine where the newest settings always win.
+    A request for the settings version already in flight is coalesced into it; a request for
+    a newer version cancels the in-flight run (at its next await) and starts immediately, and
+    any key update the superseded run still had queued for the UI is discarded, including
+    updates from a run that already finished but whose idle callbacks have not run yet.
+    """
+
+    def __init__(self, engine):
+        self._engine = engine
+        self._current = None
+        self._lock = threading.Lock()
+
+    def submit(self, version, factory):
+        """
+        Runs factory(run) as a coroutine for this settings version unless a run for the same
+        version is still in flight. Returns True if a new run was started.
+        """
+        with self._lock:
+            current = self._current
+            if current is not None:
+                running = not current.future.done()
+                if running and current.version == version:
+                    return False
+                if current.version != version:
+                    # Also for a finished run: UI updates it queued may not have been applied yet
+                    current.superseded = True
+                if running:
+                    current.future.cancel()
+                    log.info(f"LatestWinsQueue: superseding fetch for settings {current.version} with {version}")
+            run = _Run(version, self._engine)
+            run.future = self._engine.submit(factory(run))
+            self._current = run
+            return True
+
+    def cancel(self):
+        with self._lock:
+            current, self._current = self._current, None
+        if current is not None:
+            current.superseded = True
+            current.future.cancel()
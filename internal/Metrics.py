@@ -0,0 +1,247 @@
+# Import python modules
+import bisect
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from loguru import logger as log
+
+PREFIX = "github_plugin_"
+# Latency buckets in seconds, from a cached 304 to a slow GraphQL query
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# name -> (type, help); every metric the plugin records is listed here
+METRICS = {
+    "github_requests_total": ("counter", "GitHub API responses by method, endpoint and status."),
+    "github_request_duration_seconds": ("histogram", "GitHub API request latency by method and endpoint."),
+    "github_request_errors_total": ("counter", "GitHub API requests that failed without a response."),
+    "github_rate_limited_total": ("counter", "Requests held back by the local budget or rejected by GitHub."),
+    "github_rate_limit_remaining": ("gauge", "Last reported remaining rate-limit budget per resource."),
+    "contributions_cache_total": ("counter", "Contributions cache lookups and evictions by result."),
+    "contributions_render_seconds": ("histogram", "Time to render one contributions period image."),
+    "action_fetch_duration_seconds": ("histogram", "Duration of one action fetch, from queue to UI hand-off."),
+}
+
+# Opt-in exporters, read once at plugin start
+METRICS_PORT_ENV = "GITHUB_PLUGIN_METRICS_PORT"
+METRICS_FILE_ENV = "GITHUB_PLUGIN_METRICS_FILE"
+METRICS_INTERVAL_ENV = "GITHUB_PLUGIN_METRICS_INTERVAL"
+
+
+def _label_key(labels):
+    return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+
+def _escape(value):
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(key, extra=()):
+    pairs = [*key, *extra]
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+
+class _Histogram:
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # last slot is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def quantile(self, q):
+        """Upper bound of the bucket holding the q-quantile (None past the last bucket)."""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.buckets, self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return None
+
+
+class MetricsRegistry:
+    """
+    Plugin-wide counters, gauges and latency histograms, keyed by metric name and labels.
+    Recording is a dict update under one lock, cheap enough for every request and render.
+    Readable as Prometheus text (render_prometheus, MetricsServer) or as a JSON summary
+    with approximate p50/p95 (summary, write_summary).
+    """
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self._buckets = tuple(buckets)
+        self._values = {}  # (name, label key) -> float | _Histogram
+        self._lock = threading.Lock()
+        self.started_at = time.time()
+
+    def inc(self, name, amount=1, **labels):
+        key = (name, _label_key(labels))
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def set(self, name, value, **labels):
+        with self._lock:
+            self._values[(name, _label_key(labels))] = value
+
+    def observe(self, name, value, **labels):
+        key = (name, _label_key(labels))
+        with self._lock:
+            histogram = self._values.get(key)
+            if histogram is None:
+                histogram = self._values[key] = _Histogram(self._buckets)
+            histogram.observe(value)
+
+    @contextmanager
+    def time(self, name, **labels):
+        """Observes the duration of the with-block in seconds, also when it raises."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - started, **labels)
+
+    def get(self, name, **labels):
+        """Current counter/gauge value (0 if never recorded); for histograms, the observation count."""
+        with self._lock:
+            value = self._values.get((name, _label_key(labels)), 0)
+            return value.count if isinstance(value, _Histogram) else value
+
+    def _snapshot(self):
+        with self._lock:
+            items = []
+            for (name, key), value in self._values.items():
+                if isinstance(value, _Histogram):
+                    copy = _Histogram(value.buckets)
+                    copy.counts, copy.sum, copy.count = list(value.counts), value.sum, value.count
+                    value = copy
+                items.append((name, key, value))
+        return sorted(items, key=lambda item: (item[0], item[1]))
+
+    def render_prometheus(self):
+        """Prometheus text exposition format (version 0.0.4)."""
+        lines = []
+        current = None
+        for name, key, value in self._snapshot():
+            full_name = PREFIX + name
+            if name != current:
+                current = name
+                kind, help_text = METRICS.get(name, ("untyped", name))
+                lines.append(f"# HELP {full_name} {help_text}")
+                lines.append(f"# TYPE {full_name} {kind}")
+            if isinstance(value, _Histogram):
+                cumulative = 0
+                for bound, count in zip(value.buckets, value.counts):
+                    cumulative += count
+                    lines.append(f"{full_name}_bucket{_format_labels(key, [('le', repr(bound))])} {cumulative}")
+                lines.append(f'{full_name}_bucket{_format_labels(key, [("le", "+Inf")])} {value.count}')
+                lines.append(f"{full_name}_sum{_format_labels(key)} {value.sum}")
+                lines.append(f"{full_name}_count{_format_labels(key)} {value.count}")
+            else:
+                lines.append(f"{full_name}{_format_labels(key)} {value}")
+        return "\n".join(lines) + "\n"
+
+    def summary(self):
+        """JSON-friendly {name: [{labels, value | count/sum/p50/p95}]} snapshot."""
+        result = {"started_at": self.started_at, "generated_at": time.time(), "metrics": {}}
+        for name, key, value in self._snapshot():
+            entry = {"labels": dict(key)}
+            if isinstance(value, _Histogram):
+                entry.update(
+                    count=value.count,
+                    sum=round(value.sum, 6),
+                    p50=value.quantile(0.5),
+                    p95=value.quantile(0.95),
+                )
+            else:
+                entry["value"] = value
+            result["metrics"].setdefault(name, []).append(entry)
+        return result
+
+    def write_summary(self, path):
+        """Atomically replaces path with the current JSON summary."""
+        tmp_path = f"{path}.tmp"
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            with open(tmp_path, "w") as f:
+                json.dump(self.summary(), f, indent=2)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            log.warning(f"Metrics: could not write summary to {path}: {e}")
+
+
+class MetricsServer:
+    """Serves registry.render_prometheus() at GET /metrics on a daemon thread."""
+
+    def __init__(self, registry, port, host="127.0.0.1"):
+        self.registry = registry
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                if self.path.split("?", 1)[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = registry.render_prometheus().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def port(self):
+        return self._server.server_address[1]
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, name="github-metrics", daemon=True)
+        self._thread.start()
+        return self
+
+    def shutdown(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def start_exporters(registry, scheduler, environ=os.environ):
+    """
+    Starts the exporters enabled through the environment:
+    GITHUB_PLUGIN_METRICS_PORT serves Prometheus text on 127.0.0.1:<port>/metrics, and
+    GITHUB_PLUGIN_METRICS_FILE writes a JSON summary every GITHUB_PLUGIN_METRICS_INTERVAL
+    seconds (default 60). Returns the MetricsServer, or None when it is not enabled.
+    """
+    server = None
+    port = environ.get(METRICS_PORT_ENV)
+    if port:
+        try:
+            server = MetricsServer(registry, int(port)).start()
+            log.info(f"Metrics: serving Prometheus metrics on http://127.0.0.1:{server.port}/metrics")
+        except (ValueError, OSError) as e:
+            log.warning(f"Metrics: could not serve metrics on port {port!r}: {e}")
+
+    path = environ.get(METRICS_FILE_ENV)
+    if path:
+        try:
+            interval = max(5, int(environ.get(METRICS_INTERVAL_ENV, "60")))
+        except ValueError:
+            interval = 60
+        scheduler.schedule("metrics:summary", interval, lambda: registry.write_summary(path))
+        log.info(f"Metrics: writing a summary to {path} every {interval}s")
+    return server
@@ -0,0 +1,275 @@
+# Import python modules
+import contextvars
+import cProfile
+import functools
+import inspect
+import itertools
+import os
+import pstats
+import tempfile
+import threading
+import time
+import types
+from concurrent.futures import ThreadPoolExecutor
+from loguru import logger as log
+
+# GITHUB_PLUGIN_PROFILE=all (or 1) profiles every hook, or a comma-separated list of hook names
+PROFILE_ENV = "GITHUB_PLUGIN_PROFILE"
+PROFILE_DIR_ENV = "GITHUB_PLUGIN_PROFILE_DIR"
+PROFILE_MAX_MB_ENV = "GITHUB_PLUGIN_PROFILE_MAX_MB"
+
+_ALL = "all"
+_writer = None
+_writer_lock = threading.Lock()
+# The profiled coroutine hook invocation the current task runs under; blocking calls it
+# dispatches through AsyncEngine.run_blocking are profiled into that invocation
+_invocation = contextvars.ContextVar("github_plugin_profiling_invocation", default=None)
+
+
+def _enabled_targets(environ):
+    value = environ.get(PROFILE_ENV, "").strip().lower()
+    if value in ("", "0", "false", "no", "off"):
+        return None
+    if value in ("1", "true", "yes", "on", _ALL):
+        return _ALL
+    return {name.strip() for name in value.split(",") if name.strip()}
+
+
+def profiling_enabled(environ=os.environ):
+    return _enabled_targets(environ) is not None
+
+
+class _Invocation:
+    """The profiles recorded for one call of a hook, on whichever threads its work ran."""
+
+    __slots__ = ("name", "started", "profiles", "skipped", "closed", "_lock")
+
+    def __init__(self, name):
+        self.name = name
+        self.started = time.perf_counter()
+        self.profiles = []
+        self.skipped = 0
+        self.closed = False
+        self._lock = threading.Lock()
+
+    def add(self, profile):
+        with self._lock:
+            # Work still running after the hook returned (e.g. a cancelled lookup) is dropped
+            if not self.closed:
+                self.profiles.append(profile)
+
+    def skip(self):
+        with self._lock:
+            self.skipped += 1
+
+    def close(self):
+        with self._lock:
+            self.closed = True
+            return list(self.profiles), self.skipped
+
+
+class ProfileWriter:
+    """
+    Collects one profile per hook invocation and writes it as a .prof file to a directory
+    whose total size is capped; the oldest profiles go first.
+    cProfile only sees the thread it is enabled on, so each part of an invocation (every
+    loop-side step of a coroutine hook, every blocking call it runs on a worker) is recorded
+    on its own thread and the parts are merged into one file when the hook returns.
+    A thread already recording runs nested hooks unprofiled, so their time shows up in the
+    outer profile. Merging, writing and rotating happen on a dedicated writer thread.
+    On Python 3.12+ cProfile allows one active profiler per process, so parts starting while
+    another thread is recording are skipped; the count is logged with the profile.
+    """
+
+    def __init__(self, directory, max_bytes):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._local = threading.local()
+        self._seq = itertools.count(1)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="github-profiles")
+
+    def start(self, name):
+        return _Invocation(name)
+
+    def call(self, invocation, fn, *args, **kwargs):
+        """Runs fn on the current thread, recording it as part of invocation."""
+        if getattr(self._local, "active", False):
+            return fn(*args, **kwargs)
+        profile = cProfile.Profile()
+        if not self._enable(profile, invocation):
+            return fn(*args, **kwargs)
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            self._disable(profile)
+            invocation.add(profile)
+
+    def step(self, invocation, profile, fn, *args):
+        """Runs one loop-side step of a coroutine hook, accumulating it into profile."""
+        if getattr(self._local, "active", False) or not self._enable(profile, invocation):
+            return fn(*args)
+        try:
+            return fn(*args)
+        finally:
+            self._disable(profile)
+
+    def _enable(self, profile, invocation):
+        try:
+            profile.enable()
+        except ValueError:
+            # Another profiler (another thread on 3.12+, a debugger) is already active
+            invocation.skip()
+            return False
+        self._local.active = True
+        return True
+
+    def _disable(self, profile):
+        profile.disable()
+        self._local.active = False
+
+    def run(self, name, fn, *args, **kwargs):
+        """Profiles one call of a plain function hook as its own invocation."""
+        invocation = self.start(name)
+        try:
+            return self.call(invocation, fn, *args, **kwargs)
+        finally:
+            self.finish(invocation)
+
+    def finish(self, invocation):
+        elapsed = time.perf_counter() - invocation.started
+        profiles, skipped = invocation.close()
+        self._executor.submit(self._write, invocation.name, profiles, skipped, elapsed)
+
+    def _write(self, name, profiles, skipped, elapsed):
+        skipped_note = f", {skipped} part(s) skipped while another profiler was active" if skipped else ""
+        for profile in profiles:
+            profile.create_stats()
+        # pstats rejects a profile that recorded no calls
+        profiles = [profile for profile in profiles if profile.stats]
+        if not profiles:
+            log.warning(f"Profiling: {name} took {elapsed:.3f}s, nothing recorded{skipped_note}")
+            return
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        path = os.path.join(self.directory, f"{stamp}-{os.getpid()}-{next(self._seq):05d}-{name}.prof")
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            pstats.Stats(*profiles).dump_stats(path)
+            self._rotate()
+        except OSError as e:
+            log.warning(f"Profiling: could not write {path}: {e}")
+            return
+        message = f"Profiling: {name} took {elapsed:.3f}s, {len(profiles)} part(s) written to {path}{skipped_note}"
+        if skipped:
+            log.warning(message)
+        else:
+            log.info(message)
+
+    def _rotate(self):
+        profiles = []
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if entry.name.endswith(".prof") and entry.is_file():
+                    stat = entry.stat()
+                    profiles.append((stat.st_mtime, entry.name, stat.st_size, entry.path))
+        profiles.sort()
+        total = sum(size for _, _, size, _ in profiles)
+        # Always keep the newest profile, even if it alone is over the cap
+        for _, _, size, path in profiles[:-1]:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
+
+    def flush(self):
+        """Waits for the profiles queued so far to be written."""
+        self._executor.submit(lambda: None).result()
+
+
+def get_writer(environ=os.environ):
+    global _writer
+    with _writer_lock:
+        if _writer is None:
+            directory = environ.get(PROFILE_DIR_ENV) or os.path.join(tempfile.gettempdir(), "github-plugin-profiles")
+            try:
+                max_mb = float(environ.get(PROFILE_MAX_MB_ENV, "50"))
+            except ValueError:
+                max_mb = 50.0
+            _writer = ProfileWriter(directory, int(max_mb * 1024 * 1024))
+            log.info(f"Profiling: enabled, writing profiles to {directory} (cap {max_mb:g} MiB)")
+        return _writer
+
+
+def bind_blocking(fn, *args, **kwargs):
+    """
+    Returns a zero-argument callable for an executor. Inside a profiled coroutine hook it
+    records fn on the worker thread into the hook's invocation; otherwise it just calls fn.
+    """
+    call = functools.partial(fn, *args, **kwargs)
+    invocation = _invocation.get()
+    if invocation is None:
+        return call
+    return functools.partial(get_writer().call, invocation, call)
+
+
+@types.coroutine
+def _stepped(writer, invocation, coro):
+    """Drives coro one step at a time, profiling each step on the loop thread."""
+    profile = cProfile.Profile()
+    invocation.add(profile)
+    send, value = coro.send, None
+    while True:
+        try:
+            yielded = writer.step(invocation, profile, send, value)
+        except StopIteration as stop:
+            return stop.value
+        try:
+            value = yield yielded
+            send = coro.send
+        except GeneratorExit:
+            coro.close()
+            raise
+        except BaseException as e:
+            # Cancellation and other errors thrown into the hook are passed on to it
+            send, value = coro.throw, e
+
+
+def profiled(name, environ=os.environ):
+    """
+    Decorator for a fetch/render hot path, profiled only when GITHUB_PLUGIN_PROFILE selects name.
+    Each call writes one profile. For a coroutine function it merges the coroutine's own steps
+    on the event loop with every blocking call it awaits through AsyncEngine.run_blocking
+    (HTTP, JSON decoding, rendering) on the worker threads.
+    A hook called inside another profiled invocation is recorded as part of that one.
+    The environment is read when the decorator is applied (at import), so a disabled hook
+    returns the function itself and costs nothing per call.
+    """
+    targets = _enabled_targets(environ)
+    if targets is None or (targets != _ALL and name not in targets):
+        return lambda fn: fn
+
+    writer = get_writer(environ)
+
+    def decorate(fn):
+        if inspect.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def async_wrapper(*args, **kwargs):
+                if _invocation.get() is not None:
+                    return await fn(*args, **kwargs)
+                invocation = writer.start(name)
+                token = _invocation.set(invocation)
+                try:
+                    return await _stepped(writer, invocation, fn(*args, **kwargs))
+                finally:
+                    _invocation.reset(token)
+                    writer.finish(invocation)
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            return writer.run(name, fn, *args, **kwargs)
+        return wrapper
+
+    return decorate
@@ -0,0 +1,244 @@
+# Import python modules
+import asyncio
+from urllib.parse import parse_qs, urlencode, urlsplit, urlunsplit
+from loguru import logger as log
+
+# Import shared helpers
+from .RateLimit import RateLimitExceeded, PRIORITY_LOW
+
+# Number of newest open PRs whose head commits decide the CI color
+CI_SAMPLE_SIZE = 25
+
+# CI icon colors (asset names), by priority: failure > cancelled/in-progress > success
+RED_ICON = "#A00000"
+YELLOW_ICON = "#B7B700"
+GREEN_ICON = "#236B23"
+GRAY_ICON = "#595959"
+
+
+class PullRequestsFetcher:
+    """
+    UI-free open pull request pipeline: the PR count (GraphQL totalCount or REST pages) and
+    the check-run states of the newest CI_SAMPLE_SIZE heads, as coroutines over an
+    AsyncGithubClient, whose *_json calls decode responses on the engine's executor so large
+    pages never block the loop. Shared by every PR action and usable without StreamController
+    (e.g. from benchmarks/).
+    """
+
+    def __init__(self, client):
+        self.client = client
+
+    async def fetch_open_pull_requests(self, fetch_mode, owner, repo, github_token):
+        """Dispatches to the GraphQL or REST fetch; returns (status, pr_count, shas, states)."""
+        if fetch_mode == "REST":
+            return await self.fetch_open_pull_requests_rest(owner, repo, github_token)
+        return await self.fetch_open_pull_requests_graphql(owner, repo, github_token)
+
+    async def fetch_open_pull_requests_graphql(self, owner, repo, github_token):
+        """
+        Counts open PRs in a single GraphQL round trip using totalCount, and fetches the
+        statusCheckRollup check runs of the newest CI_SAMPLE_SIZE PR heads in the same request.
+        Returns (status, pr_count, shas, states) where status follows HTTP semantics (200/401/404/...)
+        and states are the check-run state tokens of every sampled head.
+        """
+        query = """
+        query($owner: String!, $name: String!, $sample: Int!) {
+          rateLimit {
+            cost
+            remaining
+            resetAt
+          }
+          repository(owner: $owner, name: $name) {
+            pullRequests(states: OPEN, first: $sample, orderBy: {field: CREATED_AT, direction: DESC}) {
+              totalCount
+              nodes {
+                headRefOid
+                commits(last: 1) {
+                  nodes {
+                    commit {
+                      statusCheckRollup {
+                        contexts(first: 100) {
+                          nodes {
+                            ... on CheckRun {
+                              status
+                              conclusion
+                            }
+                          }
+                        }
+                      }
+                    }
+                  }
+                }
+              }
+            }
+          }
+        }
+        """
+        client = self.client
+        response, data = await client.graphql_json(
+            query, {"owner": owner, "name": repo, "sample": CI_SAMPLE_SIZE}, github_token, timeout=10
+        )
+        if response.status_code != 200:
+            return response.status_code, 0, [], []
+
+        client.record_graphql_rate_limit(github_token, data)
+        repository = (data.get("data") or {}).get("repository")
+        if repository is None:
+            # GraphQL reports unknown/inaccessible repositories as a NOT_FOUND error with HTTP 200
+            return 404, 0, [], []
+
+        pull_requests = repository["pullRequests"]
+        shas, states = [], []
+        for node in pull_requests.get("nodes") or []:
+            if not node or not node.get("headRefOid"):
+                continue
+            shas.append(node["headRefOid"])
+            for commit_node in (node.get("commits") or {}).get("nodes") or []:
+                rollup = ((commit_node or {}).get("commit") or {}).get("statusCheckRollup") or {}
+                runs = [run for run in (rollup.get("contexts") or {}).get("nodes") or [] if run]
+                sha_states = self.check_run_states(runs)
+                log.info(f"SHA: {node['headRefOid']}, Check run states: {sha_states}")
+                states.extend(sha_states)
+        return 200, pull_requests.get("totalCount", 0), shas, states
+
+    async def fetch_open_pull_requests_rest(self, owner, repo, github_token):
+        """
+        Counts open PRs over every /pulls page. When the first page links rel="last", the
+        remaining pages are requested concurrently; otherwise rel="next" is walked in order.
+        Returns (status, pr_count, shas, states) where shas are the heads of the newest
+        CI_SAMPLE_SIZE PRs and states is None (check runs are fetched separately over REST).
+        """
+        client = self.client
+        url = f"{client.api_url}/repos/{owner}/{repo}/pulls"
+
+        # Fetch first page at 100 for efficient pagination; CI checks limited to first 25 SHAs
+        first_response, first_page = await client.get_json(
+            url, github_token, params={"per_page": 100, "state": "open"}, timeout=10
+        )
+        if first_response.status_code != 200:
+            return first_response.status_code, 0, [], None
+
+        # Count all pages for the total
+        pr_count = len(first_page)
+        page_urls = self._remaining_page_urls(first_response)
+        if page_urls is not None:
+            pages = await asyncio.gather(
+                *(client.get_json(page_url, github_token, timeout=10) for page_url in page_urls)
+            )
+            pr_count += sum(len(page) for response, page in pages if response.status_code == 200)
+        else:
+            next_url = self._next_page_url(first_response)
+            while next_url:
+                response, page = await client.get_json(next_url, github_token, timeout=10)
+                if response.status_code != 200:
+                    break
+                pr_count += len(page)
+                next_url = self._next_page_url(response)
+
+        shas = [
+            pr["head"]["sha"]
+            for pr in first_page[:CI_SAMPLE_SIZE]
+            if isinstance(pr.get("head"), dict) and "sha" in pr["head"]
+        ]
+        return 200, pr_count, shas, None
+
+    @staticmethod
+    def _remaining_page_urls(response):
+        """
+        URLs of pages 2..N built from the Link rel="last" URL, [] for a single page, or None
+        when the header has a next page but no usable last page to enumerate from.
+        """
+        link = response.headers.get("Link", "")
+        if 'rel="next"' not in link:
+            return []
+        for part in link.split(","):
+            if 'rel="last"' in part:
+                last_url = urlsplit(part.split(";")[0].strip().strip("<>"))
+                query = parse_qs(last_url.query)
+                try:
+                    last_page = int(query["page"][0])
+                except (KeyError, ValueError):
+                    return None
+                urls = []
+                for page in range(2, last_page + 1):
+                    query["page"] = [str(page)]
+                    urls.append(urlunsplit(last_url._replace(query=urlencode(query, doseq=True))))
+                return urls
+        return None
+
+    @staticmethod
+    def _next_page_url(response):
+        link = response.headers.get("Link", "")
+        for part in link.split(","):
+            if 'rel="next"' in part:
+                return part.split(";")[0].strip().strip("<>")
+        return None
+
+    async def collect_check_run_states(self, owner, repo, shas, github_token):
+        # The per-SHA lookups run concurrently on the engine's bounded executor
+        tasks = [
+            asyncio.ensure_future(self._fetch_check_run_states(owner, repo, sha, github_token))
+            for sha in shas
+        ]
+
+        states = []
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                states.extend(await next_done)
+                if "failure" in states:
+                    # failure is the highest priority state; remaining lookups cannot change the color
+                    log.info(f"Failure seen for {owner}/{repo}, skipping remaining check-run lookups.")
+                    break
+        finally:
+            # Drop lookups that have not started yet (running ones finish and are ignored)
+            for task in tasks:
+                task.cancel()
+        return states
+
+    async def _fetch_check_run_states(self, owner, repo, sha, github_token):
+        client = self.client
+        url = f"{client.api_url}/repos/{owner}/{repo}/commits/{sha}/check-runs"
+        try:
+            response, data = await client.get_json(url, github_token, timeout=10, priority=PRIORITY_LOW)
+            if response.status_code == 200:
+                sha_states = self.check_run_states(data.get("check_runs", []))
+                log.info(f"SHA: {sha}, Check run states: {sha_states}")
+                return sha_states
+            log.warning(f"Failed to fetch check-runs for SHA {sha}: {response.status_code}")
+        except RateLimitExceeded:
+            raise
+        except Exception as e:
+            log.error(f"Exception while fetching check-runs for {sha}: {e}")
+        return []
+
+    @staticmethod
+    def check_run_states(check_runs):
+        """
+        Maps check runs to state tokens: the conclusion of every completed run plus a single
+        "in_progress" sentinel if any run is still queued or running.
+        Accepts both the REST shape (lowercase) and the GraphQL shape (uppercase enums).
+        """
+        states = []
+        in_progress = False
+        for run in check_runs:
+            status = (run.get("status") or "").lower()
+            conclusion = (run.get("conclusion") or "").lower()
+            if status == "completed" and conclusion:
+                states.append(conclusion)
+            elif status in ("in_progress", "queued"):
+                in_progress = True
+        if in_progress:
+            states.append("in_progress")
+        return states
+
+    @staticmethod
+    def status_icon_color(states):
+        """Icon color for a list of check-run states."""
+        # Decide icon and count label color based on priority: failure > cancelled/in-progress > success
+        if "failure" in states:
+            return RED_ICON
+        elif "cancelled" in states or "in_progress" in states:
+            return YELLOW_ICON
+        elif "success" in states:
+            return GREEN_ICON
+        return GRAY_ICON
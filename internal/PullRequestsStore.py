@@ -0,0 +1,88 @@
+# Import python modules
+import os
+import sqlite3
+import threading
+from loguru import logger as log
+
+from .TokenFingerprint import token_fingerprint
+
+
+class PullRequestsStore:
+    """
+    SQLite-backed last-known state of each PR key: open count, CI icon color and fetch time
+    per (owner/repo, token). Lets a key show its previous result immediately on startup and
+    while a refresh is running. Rows are mirrored in memory so reads after the first are free.
+    """
+
+    def __init__(self, path):
+        self._path = path
+        self._conn = None
+        self._memory = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(github_token, owner, repo):
+        return f"{owner}/{repo}".lower(), token_fingerprint(github_token)
+
+    def _connection(self):
+        """Opens the database on first use. Caller holds the lock."""
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self._path), exist_ok=True)
+            self._conn = sqlite3.connect(self._path, timeout=5, check_same_thread=False)
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS pull_requests (
+                    repo TEXT NOT NULL,
+                    token_fingerprint TEXT NOT NULL,
+                    pr_count INTEGER NOT NULL,
+                    icon_color TEXT NOT NULL,
+                    fetched_at REAL NOT NULL,
+                    PRIMARY KEY (repo, token_fingerprint)
+                )
+                """
+            )
+            self._conn.commit()
+        return self._conn
+
+    def load(self, github_token, owner, repo):
+        """Returns {"pr_count", "icon_color", "fetched_at"} of the last stored result, or None."""
+        key = self._key(github_token, owner, repo)
+        try:
+            with self._lock:
+                if key in self._memory:
+                    return self._memory[key]
+                row = self._connection().execute(
+                    "SELECT pr_count, icon_color, fetched_at FROM pull_requests "
+                    "WHERE repo = ? AND token_fingerprint = ?",
+                    key,
+                ).fetchone()
+                state = None
+                if row is not None:
+                    state = {"pr_count": row[0], "icon_color": row[1], "fetched_at": row[2]}
+                self._memory[key] = state
+                return state
+        except sqlite3.Error as e:
+            log.warning(f"PullRequestsStore: could not load {owner}/{repo}: {e}")
+            return None
+
+    def save(self, github_token, owner, repo, pr_count, icon_color, fetched_at):
+        key = self._key(github_token, owner, repo)
+        state = {"pr_count": pr_count, "icon_color": icon_color, "fetched_at": fetched_at}
+        try:
+            with self._lock:
+                self._memory[key] = state
+                conn = self._connection()
+                conn.execute(
+                    "INSERT OR REPLACE INTO pull_requests "
+                    "(repo, token_fingerprint, pr_count, icon_color, fetched_at) VALUES (?, ?, ?, ?, ?)",
+                    (*key, pr_count, icon_color, fetched_at),
+                )
+                conn.commit()
+        except sqlite3.Error as e:
+            log.warning(f"PullRequestsStore: could not save {owner}/{repo}: {e}")
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -0,0 +1,123 @@
+# Import python modules
+import threading
+import time
+from datetime import datetime
+
+# Request priorities: high-priority work (PR counts, contribution calendars) may spend the
+# whole budget, low-priority work (check-run lookups) is deferred once the reserve is reached.
+PRIORITY_HIGH = 0
+PRIORITY_LOW = 1
+
+
+class RateLimitExceeded(Exception):
+    """
+    Raised instead of sending a request when the token's budget for a resource is exhausted
+    (or reserved for higher-priority work), or when GitHub rejected a request for rate limiting.
+    resume_at is the epoch time at which the work can be retried.
+    """
+
+    def __init__(self, resource, resume_at):
+        super().__init__(f"GitHub rate limit reached for '{resource}', resuming at {resume_at:.0f}")
+        self.resource = resource
+        self.resume_at = resume_at
+
+
+class _Budget:
+    __slots__ = ("limit", "remaining", "reset_at", "blocked_until", "cost")
+
+    def __init__(self):
+        self.limit = None
+        self.remaining = None
+        self.reset_at = 0.0
+        self.blocked_until = 0.0
+        self.cost = 1
+
+
+class RateLimitBudget:
+    """
+    Tracks GitHub's rate-limit budget per (token, resource), shared by every action that uses
+    the same token. Fed from X-RateLimit-* / Retry-After response headers and the GraphQL
+    rateLimit { cost remaining resetAt } field, and consulted before every request.
+    """
+
+    def __init__(self, low_priority_reserve=0.1):
+        # Fraction of the hourly limit kept back for high-priority requests
+        self._low_priority_reserve = low_priority_reserve
+        self._budgets = {}  # (token, resource) -> _Budget
+        self._lock = threading.Lock()
+
+    def check(self, token, resource, priority=PRIORITY_HIGH):
+        """Raises RateLimitExceeded if a request of this priority should not be sent now."""
+        now = time.time()
+        with self._lock:
+            budget = self._budgets.get((token, resource))
+            if budget is None:
+                return
+            if budget.blocked_until > now:
+                raise RateLimitExceeded(resource, budget.blocked_until)
+            if budget.remaining is None or budget.reset_at <= now:
+                # Unknown budget or the window already rolled over: let the request through
+                return
+            reserve = 0
+            if priority >= PRIORITY_LOW and budget.limit:
+                reserve = int(budget.limit * self._low_priority_reserve)
+            if budget.remaining - budget.cost < reserve:
+                raise RateLimitExceeded(resource, budget.reset_at)
+            # Count the request optimistically so concurrent callers see the reduced budget
+            budget.remaining -= budget.cost
+
+    def update_from_headers(self, token, resource, headers, status_code=200):
+        """Records the budget reported by a response; returns the resume time if it was rate limited."""
+        resource = headers.get("X-RateLimit-Resource", resource)
+        now = time.time()
+        with self._lock:
+            budget = self._budgets.setdefault((token, resource), _Budget())
+            try:
+                if "X-RateLimit-Limit" in headers:
+                    budget.limit = int(headers["X-RateLimit-Limit"])
+                if "X-RateLimit-Remaining" in headers:
+                    budget.remaining = int(headers["X-RateLimit-Remaining"])
+                if "X-RateLimit-Reset" in headers:
+                    budget.reset_at = float(headers["X-RateLimit-Reset"])
+            except (TypeError, ValueError):
+                pass
+
+            if status_code not in (403, 429):
+                return None
+            retry_after = headers.get("Retry-After")
+            if retry_after is not None:
+                try:
+                    budget.blocked_until = now + float(retry_after)
+                except (TypeError, ValueError):
+                    budget.blocked_until = now + 60
+            elif budget.remaining == 0:
+                budget.blocked_until = budget.reset_at
+            else:
+                # A plain 403 (permissions, ...) is not a rate limit
+                return None
+            return budget.blocked_until
+
+    def update_from_graphql(self, token, rate_limit):
+        """Records the GraphQL rateLimit { limit cost remaining resetAt } field of a response."""
+        if not rate_limit:
+            return
+        with self._lock:
+            budget = self._budgets.setdefault((token, "graphql"), _Budget())
+            try:
+                if rate_limit.get("limit") is not None:
+                    budget.limit = int(rate_limit["limit"])
+                if rate_limit.get("remaining") is not None:
+                    budget.remaining = int(rate_limit["remaining"])
+                if rate_limit.get("cost") is not None:
+                    budget.cost = max(1, int(rate_limit["cost"]))
+                if rate_limit.get("resetAt"):
+                    budget.reset_at = datetime.fromisoformat(
+                        rate_limit["resetAt"].replace("Z", "+00:00")
+                    ).timestamp()
+            except (TypeError, ValueError):
+                pass
+
+    def remaining(self, token, resource):
+        with self._lock:
+            budget = self._budgets.get((token, resource))
+            return None if budget is None else budget.remaining
@@ -0,0 +1,154 @@
+# Import python modules
+import heapq
+import itertools
+import math
+import random
+import threading
+import time
+from loguru import logger as log
+
+
+class _Job:
+    __slots__ = ("job_id", "interval", "callback", "due", "seq")
+
+    def __init__(self, job_id, interval, callback, due, seq):
+        self.job_id = job_id
+        self.interval = interval  # None for one-shot jobs
+        self.callback = callback
+        self.due = due
+        self.seq = seq
+
+
+class RefreshScheduler:
+    """
+    Plugin-owned scheduler for every periodic refresh and one-shot resume.
+    Jobs live in a priority queue ordered by their next due time and a single GLib timeout is
+    armed for the earliest one, instead of one GLib source per action instance. Due times are
+    spread with jitter so buttons configured together do not fire in the same instant, and
+    jobs falling due within batch_window seconds of each other run in the same wakeup.
+    """
+
+    def __init__(self, jitter=0.1, batch_window=5.0):
+        self._jitter = jitter
+        self._batch_window = batch_window
+        self._heap = []   # (due, seq, job_id); stale entries are skipped lazily
+        self._jobs = {}   # job_id -> _Job
+        self._seq = itertools.count()
+        self._lock = threading.Lock()
+        self._timer_id = None
+        self._timer_due = None
+
+    @staticmethod
+    def _glib():
+        try:
+            from gi.repository import GLib
+            return GLib
+        except ImportError:
+            return None
+
+    def schedule(self, job_id, interval, callback):
+        """
+        Runs callback every interval seconds, replacing any job with the same id.
+        The first run is due after one interval plus up to jitter * interval.
+        """
+        delay = interval + random.uniform(0, interval * self._jitter)
+        self._add(job_id, interval, callback, delay)
+
+    def schedule_once(self, job_id, delay, callback):
+        """Runs callback once after delay seconds, replacing any job with the same id."""
+        self._add(job_id, None, callback, delay)
+
+    def cancel(self, job_id):
+        with self._lock:
+            self._jobs.pop(job_id, None)
+
+    def next_run(self, job_id):
+        """Epoch time of the job's next run, or None if it is not scheduled."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return None if job is None else job.due
+
+    def next_runs(self):
+        """Snapshot of {job_id: next due epoch time} for every scheduled job."""
+        with self._lock:
+            return {job_id: job.due for job_id, job in self._jobs.items()}
+
+    def shutdown(self):
+        with self._lock:
+            self._jobs.clear()
+            self._heap.clear()
+            self._cancel_timer()
+
+    def _add(self, job_id, interval, callback, delay):
+        with self._lock:
+            job = _Job(job_id, interval, callback, time.time() + max(0.0, delay), next(self._seq))
+            self._jobs[job_id] = job
+            heapq.heappush(self._heap, (job.due, job.seq, job_id))
+            self._arm_timer()
+
+    def _cancel_timer(self):
+        GLib = self._glib()
+        if self._timer_id is not None and GLib is not None:
+            try:
+                GLib.source_remove(self._timer_id)
+            except Exception:
+                pass
+        self._timer_id = None
+        self._timer_due = None
+
+    def _peek(self):
+        # Drop heap entries for cancelled or rescheduled jobs
+        while self._heap:
+            due, seq, job_id = self._heap[0]
+            job = self._jobs.get(job_id)
+            if job is not None and job.seq == seq:
+                return due
+            heapq.heappop(self._heap)
+        return None
+
+    def _arm_timer(self):
+        """Arms the single GLib timeout for the earliest due job. Caller holds the lock."""
+        due = self._peek()
+        if due is None:
+            self._cancel_timer()
+            return
+        if self._timer_id is not None and self._timer_due is not None and self._timer_due <= due:
+            return
+        GLib = self._glib()
+        if GLib is None:
+            return
+        self._cancel_timer()
+        delay = max(1, math.ceil(due - time.time()))
+        self._timer_due = due
+        self._timer_id = GLib.timeout_add_seconds(delay, self._on_timer)
+
+    def _on_timer(self):
+        now = time.time()
+        batch = []
+        with self._lock:
+            self._timer_id = None
+            self._timer_due = None
+            # Collect every job due now or within the batch window
+            while True:
+                due = self._peek()
+                if due is None or due > now + self._batch_window:
+                    break
+                _, _, job_id = heapq.heappop(self._heap)
+                batch.append(self._jobs[job_id])
+            # Reschedule periodic jobs only after the batch is collected so each runs once per wakeup
+            for job in batch:
+                if job.interval is None:
+                    del self._jobs[job.job_id]
+                else:
+                    jitter = job.interval * self._jitter
+                    job.due = now + job.interval + random.uniform(-jitter / 2, jitter / 2)
+                    job.seq = next(self._seq)
+                    heapq.heappush(self._heap, (job.due, job.seq, job.job_id))
+            self._arm_timer()
+
+        for job in batch:
+            try:
+                job.callback()
+            except Exception as e:
+                log.error(f"RefreshScheduler: job {job.job_id} failed: {e}")  # Never crash the app
+        return False  # Re-armed explicitly above
@@ -0,0 +1,98 @@
+# Import python modules
+import json
+import threading
+from collections import OrderedDict
+
+from requests.structures import CaseInsensitiveDict
+
+
+class CachedResponse:
+    """
+    Minimal stand-in for requests.Response built from a cached entry after the server
+    answered 304 Not Modified. Exposes the attributes the actions read
+    (status_code, headers, content, json()).
+    """
+
+    from_cache = True
+
+    def __init__(self, entry, revalidation_response):
+        self.status_code = 200
+        self.url = entry.url
+        self.content = entry.content
+        # Cached headers (Link, ...) overlaid with the fresh 304 headers (rate limit, ETag, ...)
+        self.headers = CaseInsensitiveDict(entry.headers)
+        self.headers.update(revalidation_response.headers)
+        self._entry = entry
+
+    def json(self):
+        return self._entry.json()
+
+
+class _CacheEntry:
+    __slots__ = ("url", "etag", "last_modified", "headers", "content", "_json", "_json_loaded")
+
+    def __init__(self, response):
+        self.url = response.url
+        self.etag = response.headers.get("ETag")
+        self.last_modified = response.headers.get("Last-Modified")
+        self.headers = CaseInsensitiveDict(response.headers)
+        self.content = response.content
+        self._json = None
+        self._json_loaded = False
+
+    def conditional_headers(self):
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def json(self):
+        # Decode once and share the result between every 304 replay
+        if not self._json_loaded:
+            self._json = json.loads(self.content)
+            self._json_loaded = True
+        return self._json
+
+
+class ResponseCache:
+    """
+    Bounded LRU cache of validated GET responses keyed by (url, params, token).
+    Stores ETag/Last-Modified so repeated requests can be sent as conditional requests;
+    GitHub answers 304 without counting it against the rate limit.
+    """
+
+    def __init__(self, max_entries=512):
+        self._max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(url, params, token):
+        return url, tuple(sorted((params or {}).items())), token
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def store(self, key, response):
+        if not (response.headers.get("ETag") or response.headers.get("Last-Modified")):
+            return
+        entry = _CacheEntry(response)
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def discard(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,56 @@
+# Import python modules
+from types import MappingProxyType
+
+
+class SettingsSnapshot:
+    """
+    Immutable view of the plugin and action settings taken at one settings version.
+    A fetch reads a single snapshot instead of calling get_settings() repeatedly.
+    """
+
+    __slots__ = ("version", "plugin", "action")
+
+    def __init__(self, version, plugin_settings, action_settings):
+        self.version = version
+        self.plugin = self._freeze(plugin_settings)
+        self.action = self._freeze(action_settings)
+
+    @staticmethod
+    def _freeze(settings):
+        if isinstance(settings, MappingProxyType):
+            return settings
+        return MappingProxyType(dict(settings))
+
+    def get(self, key, default=None):
+        """Looks up the action settings first, then the plugin settings."""
+        if key in self.action:
+            return self.action[key]
+        return self.plugin.get(key, default)
+
+
+class VersionedSettingsMixin:
+    """
+    Mixin for actions: counts set_settings() calls so that, combined with the plugin's
+    settings_version, on_tick can detect changes with a tuple compare instead of merging
+    and comparing whole settings dicts every tick.
+    """
+
+    _action_settings_version = 0
+    _settings_snapshot = None
+
+    def set_settings(self, settings):
+        super().set_settings(settings)
+        self._action_settings_version += 1
+
+    @property
+    def settings_version(self):
+        return self.plugin_base.settings_version, self._action_settings_version
+
+    def settings_snapshot(self):
+        """Returns the SettingsSnapshot for the current version, rebuilding it only after a change."""
+        version = self.settings_version
+        snapshot = self._settings_snapshot
+        if snapshot is None or snapshot.version != version:
+            snapshot = SettingsSnapshot(version, self.plugin_base.get_settings_snapshot(), self.get_settings())
+            self._settings_snapshot = snapshot
+        return snapshot
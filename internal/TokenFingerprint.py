@@ -0,0 +1,7 @@
+# Import python modules
+import hashlib
+
+
+def token_fingerprint(github_token):
+    """Stable key for a token in on-disk stores, so the token itself is never written."""
+    return hashlib.sha256(github_token.encode("utf-8")).hexdigest()[:32]
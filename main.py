@@ -8,10 +8,66 @@ from src.backend.DeckManagement.InputIdentifier import Input
 from .actions.FetchPullRequests import PullRequestsActions
 from .actions.Contributions import ContributionsActions
 
+# Import python modules
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+
+# Import shared helpers
+from .internal.GithubClient import GithubClient
+from .internal.AsyncEngine import AsyncEngine
+from .internal.AsyncGithubClient import AsyncGithubClient
+from .internal.PullRequestsFetcher import PullRequestsFetcher
+from .internal.RefreshScheduler import RefreshScheduler
+from .internal.ContributionsStore import ContributionsStore
+from .internal.PullRequestsStore import PullRequestsStore
+from .internal.ImageMemoryCache import ImageMemoryCache
+from .internal.ImageCacheStore import ImageCacheStore
+from .internal.ContributionsBatcher import ContributionsBatcher
+from .internal.Metrics import MetricsRegistry, start_exporters
+
 class PullRequestsPlugin(PluginBase):
     def __init__(self):
+        # Bumped by set_settings() so actions can detect changes with an integer compare
+        self.settings_version = 0
+        self._settings_snapshot = None
+        self._settings_version_lock = threading.Lock()
+
         super().__init__()
 
+        # Plugin-wide counters and latency histograms; exported only when enabled through the environment
+        self.metrics = MetricsRegistry()
+        # One pooled HTTP client shared by every action instance
+        self.github_client = GithubClient(metrics=self.metrics)
+        # One asyncio loop on a background thread runs every fetch; HTTP calls overlap on its bounded executor
+        self.async_engine = AsyncEngine()
+        self.async_github_client = AsyncGithubClient(self.github_client, self.async_engine)
+        # UI-free PR count and check-run pipeline used by every PR action
+        self.pull_requests_fetcher = PullRequestsFetcher(self.async_github_client)
+        # Contribution calendars of users refreshing together go out as one aliased GraphQL query
+        self.contributions_batcher = ContributionsBatcher(self.github_client)
+        # One priority-queue scheduler drives every periodic refresh instead of a GLib timer per key
+        self.refresh_scheduler = RefreshScheduler()
+        self.metrics_server = start_exporters(self.metrics, self.refresh_scheduler)
+        # Contributions cache persisted next to the image cache, so restarts render without the API
+        self.contributions_store = ContributionsStore(
+            os.path.join(self.PATH, "contributions_cache", "contributions.db")
+        )
+        # Last known count and CI color per PR key, shown while a fetch revalidates it
+        self.pull_requests_store = PullRequestsStore(
+            os.path.join(self.PATH, "pull_requests_cache", "pull_requests.db")
+        )
+        # Rendered images are shown from memory; PNG copies are written off the UI path, one at a time
+        self.image_cache = ImageMemoryCache()
+        self.image_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="contributions-png")
+        # Per-user, size-bounded PNG directory; its GC runs on the writer thread, never in a fetch
+        self.image_store = ImageCacheStore(
+            os.path.join(self.PATH, "contributions_cache"), self.image_writer
+        )
+        self.refresh_scheduler.schedule_once("image-cache:gc:startup", 60, self.image_store.schedule_gc)
+        self.refresh_scheduler.schedule("image-cache:gc", 6 * 3600, self.image_store.schedule_gc)
+
         key_only = {
             Input.Key: ActionInputSupport.SUPPORTED,
             Input.Dial: ActionInputSupport.UNSUPPORTED,
@@ -46,3 +102,16 @@ class PullRequestsPlugin(PluginBase):
             plugin_version="1.0.0",
             app_version="1.1.1-alpha"
         )
+
+    def set_settings(self, settings):
+        super().set_settings(settings)
+        with self._settings_version_lock:
+            self.settings_version += 1
+            self._settings_snapshot = None
+
+    def get_settings_snapshot(self):
+        """Read-only view of the plugin settings, rebuilt only after set_settings() bumps the version."""
+        with self._settings_version_lock:
+            if self._settings_snapshot is None:
+                self._settings_snapshot = MappingProxyType(dict(self.get_settings()))
+            return self._settings_snapshot
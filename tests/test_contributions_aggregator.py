@@ -0,0 +1,60 @@
+# Import python modules
+import os
+import sys
+from datetime import date
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from internal.ContributionsAggregator import (  # noqa: E402
+    bimonthly_ranges,
+    monthly_ranges,
+    quarterly_ranges,
+    rolling_week_ranges,
+)
+
+
+def test_monthly_ranges_end_on_month_ends():
+    assert monthly_ranges(date(2024, 3, 31), periods=3) == [
+        (date(2024, 1, 1), date(2024, 1, 31)),
+        (date(2024, 2, 1), date(2024, 2, 29)),
+        (date(2024, 3, 1), date(2024, 3, 31)),
+    ]
+    # Any day of the month selects the whole month
+    assert monthly_ranges(date(2023, 2, 14), periods=1) == [(date(2023, 2, 1), date(2023, 2, 28))]
+
+
+def test_monthly_ranges_cross_the_year_boundary():
+    assert monthly_ranges(date(2025, 1, 1), periods=2) == [
+        (date(2024, 12, 1), date(2024, 12, 31)),
+        (date(2025, 1, 1), date(2025, 1, 31)),
+    ]
+
+
+def test_bimonthly_ranges_cover_twelve_months_back_to_back():
+    ranges = bimonthly_ranges(date(2025, 1, 15))
+    assert ranges[0] == (date(2024, 2, 1), date(2024, 3, 31))
+    assert ranges[-1] == (date(2024, 12, 1), date(2025, 1, 31))
+    assert len(ranges) == 6
+    for (_, end), (start, _) in zip(ranges, ranges[1:]):
+        assert (start - end).days == 1
+
+
+def test_quarterly_ranges_follow_calendar_quarters():
+    assert quarterly_ranges(date(2025, 2, 28), periods=2) == [
+        (date(2024, 10, 1), date(2024, 12, 31)),
+        (date(2025, 1, 1), date(2025, 3, 31)),
+    ]
+    # The last day of a quarter still belongs to it
+    assert quarterly_ranges(date(2024, 6, 30), periods=1) == [(date(2024, 4, 1), date(2024, 6, 30))]
+    assert quarterly_ranges(date(2024, 12, 31), periods=1) == [(date(2024, 10, 1), date(2024, 12, 31))]
+
+
+def test_rolling_week_ranges_end_on_last_date():
+    assert rolling_week_ranges(date(2025, 1, 3), weeks=1, periods=2) == [
+        (date(2024, 12, 21), date(2024, 12, 27)),
+        (date(2024, 12, 28), date(2025, 1, 3)),
+    ]
+    # Windows are 7 * weeks days long, inclusive of both ends
+    ((start, end),) = rolling_week_ranges(date(2024, 3, 1), weeks=4)
+    assert (start, end) == (date(2024, 2, 3), date(2024, 3, 1))
+    assert (end - start).days + 1 == 28
@@ -0,0 +1,86 @@
+# Import python modules
+import os
+import random
+import sys
+from datetime import date, timedelta
+
+from PIL import Image, ImageDraw
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from internal.ContributionCalendar import ContributionCalendar  # noqa: E402
+from internal.ContributionsAggregator import bimonthly_ranges  # noqa: E402
+from internal.ContributionsRenderer import render_period  # noqa: E402
+
+
+def _reference_color(count):
+    if count == 0:
+        return "#3d444d"
+    elif count < 8:
+        return "#2d8659"
+    elif count < 15:
+        return "#4ca96c"
+    elif count < 22:
+        return "#73c48f"
+    else:
+        return "#a3d9a5"
+
+
+def _reference_render(date_to_count, period_start, period_end):
+    """The ImageDraw renderer render_period replaced, kept as the pixel reference."""
+    cell_size = 12
+    if period_start.weekday() != 6:
+        first_sunday = period_start - timedelta(days=period_start.weekday() + 1)
+    else:
+        first_sunday = period_start
+    last_saturday = period_end + timedelta(days=(5 - period_end.weekday()) % 7)
+    weeks = []
+    current = first_sunday
+    while current <= last_saturday:
+        weeks.append(current)
+        current += timedelta(days=7)
+
+    img = Image.new("RGB", (len(weeks) * cell_size, 7 * cell_size), (255, 255, 255))
+    draw = ImageDraw.Draw(img)
+    for col, week_start in enumerate(weeks):
+        for d in range(7):
+            day = week_start + timedelta(days=d)
+            x = col * cell_size
+            y = d * cell_size
+            box = [x, y, x + cell_size - 1, y + cell_size - 1]
+            if period_start <= day <= period_end:
+                color = _reference_color(date_to_count.get(day.strftime("%Y-%m-%d"), 0))
+            else:
+                color = "white"
+            draw.rectangle(box, fill=color)
+            draw.rectangle(box, outline="#777777", width=1)
+    return img
+
+
+def _random_days(rng, last_day):
+    activity = rng.choice((0.0, 0.15, 0.6, 1.0))
+    first_day = last_day - timedelta(days=rng.randint(30, 400))
+    days = []
+    day = first_day
+    while day <= last_day:
+        count = rng.choice((rng.randint(1, 40), rng.randint(0, 7))) if rng.random() < activity else 0
+        days.append((day.isoformat(), count))
+        day += timedelta(days=1)
+    return days
+
+
+def test_render_period_matches_imagedraw_reference():
+    rng = random.Random(12)
+    for _ in range(60):
+        last_day = date(2024, 1, 1) + timedelta(days=rng.randint(0, 730))
+        days = _random_days(rng, last_day)
+        calendar = ContributionCalendar.from_days(days)
+        date_to_count = dict(days)
+        # The action's bimonthly periods plus an arbitrary range reaching past the calendar
+        odd_start = last_day - timedelta(days=rng.randint(0, 450))
+        odd_range = (odd_start, odd_start + timedelta(days=rng.randint(0, 90)))
+        for period_start, period_end in [*bimonthly_ranges(last_day), odd_range]:
+            expected = _reference_render(date_to_count, period_start, period_end)
+            actual = render_period(calendar, period_start, period_end)
+            assert actual.size == expected.size
+            assert actual.tobytes() == expected.tobytes(), f"{period_start}..{period_end} differs"